@@ -15,11 +15,14 @@ release   = 'FEM.edu-v1.0.1'
 # https://www.jetbrains.com/pycharm/guide/tutorials/sphinx_sites/documentation/
 import os
 import sys
-# sys.path.insert(0, os.path.abspath("../../src/elements"))
-# sys.path.insert(0, os.path.abspath("../../src/materials"))
-# sys.path.insert(0, os.path.abspath("../../src/solver"))
-sys.path.insert(0, os.path.abspath("../../src"))
-sys.path.insert(0, os.path.abspath("."))
+# insert only the first candidate that actually holds the femedu package
+_conf_dir = os.path.dirname(os.path.abspath(__file__))
+for _src in ("../../src", "../src", "../../../src"):
+    _src = os.path.normpath(os.path.join(_conf_dir, _src))
+    if os.path.isfile(os.path.join(_src, "femedu", "__init__.py")):
+        if _src not in sys.path:
+            sys.path.insert(0, _src)
+        break
 
 from sphinx_gallery.sorting import FileNameSortKey, ExplicitOrder
 
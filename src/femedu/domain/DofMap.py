@@ -0,0 +1,271 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+class DofMap():
+    r"""
+    class: flattened element-to-dof maps for fast assembly (CSR layout)
+
+    The per-node :code:`dof_maps` of all elements are collected once into compressed-row arrays:
+
+    .. list-table:: map arrays
+        :header-rows: 1
+
+        * - name
+          - shape
+          - description
+        * - **elem_ptr**
+          - (nelem+1,)
+          - entries of element :code:`e` are :code:`elem_ptr[e]:elem_ptr[e+1]` in **node_ptr**
+        * - **node_ptr**
+          - (nentries+1,)
+          - d.o.f.s of node entry :code:`k` are :code:`node_ptr[k]:node_ptr[k+1]` in the arrays below
+        * - **dof_rows**
+          - (ndofs,)
+          - pool row of the lead node carrying that d.o.f.
+        * - **local_idx**
+          - (ndofs,)
+          - local index of that d.o.f. at its (lead) node
+        * - **cols**
+          - (ndofs,)
+          - pool column of that d.o.f.
+        * - **elem_pos**
+          - (max_ID+1,)
+          - position of an element in the map by element ID (-1 if not included)
+
+    The map follows :py:meth:`Node.getIdx4Element`: nodes carrying a transformation contribute all of their d.o.f.s.
+
+    If **nodes** are given, the map also holds the pool location of every global d.o.f. of these nodes,
+    numbered in the order used by :py:meth:`Solver.assemble` (lead nodes only).  This enables
+    :py:meth:`updateDisp` to apply a global displacement correction in a single operation.
+
+    :param elements: list of elements
+    :param pool: the :py:class:`NodePool` holding the nodes of these elements
+    :param nodes: list of nodes defining the global d.o.f. numbering (optional)
+    """
+
+    def __init__(self, elements, pool, nodes=()):
+        self.pool     = pool
+        self.nelem    = len(elements)
+        self.nnodes   = len(nodes)
+
+        # pool rows of all nodes in this map (see isCurrent)
+        self.rows     = np.unique(np.array([ node._row for element in elements for node in element.nodes ]
+                                           + [ node._row for node in nodes ], dtype=np.intp))
+        self.revision = pool.token(self.rows)[0]
+
+        elem_ptr  = [0]
+        node_ptr  = [0]
+        dof_rows  = []
+        local_idx = []
+        cols      = []
+
+        for element in elements:
+            for node in element.nodes:
+                lead = node.lead
+                while not lead.is_lead:
+                    lead = lead.lead
+
+                if lead._transform:
+                    idx = np.arange(lead.ndofs)
+                else:
+                    idx = np.asarray(lead.dof_maps[element], dtype=np.int32)
+
+                dof_rows.extend([lead._row] * len(idx))
+                local_idx.extend(idx)
+                cols.extend(lead._slots[idx])
+                node_ptr.append(node_ptr[-1] + len(idx))
+
+            elem_ptr.append(len(node_ptr) - 1)
+
+        self.elem_pos = np.full(max([ element.ID for element in elements ], default=-1) + 1, -1, dtype=np.intp)
+        for e, element in enumerate(elements):
+            self.elem_pos[element.ID] = e
+
+        self.elem_ptr  = np.array(elem_ptr,  dtype=np.intp)
+        self.node_ptr  = np.array(node_ptr,  dtype=np.intp)
+        self.dof_rows  = np.array(dof_rows,  dtype=np.intp)
+        self.local_idx = np.array(local_idx, dtype=np.intp)
+        self.cols      = np.array(cols,      dtype=np.intp)
+
+        # pool location of the global d.o.f.s (nodes with a transformation are updated individually)
+        upd_rows = []
+        upd_cols = []
+        upd_idx  = []
+        self.transformed = []
+
+        ndof = 0
+        for node in nodes:
+            if node.isLead():
+                idx = ndof + np.arange(node.ndofs)
+                if node._transform:
+                    self.transformed.append((node, idx))
+                else:
+                    upd_rows.extend([node._row] * node.ndofs)
+                    upd_cols.extend(node._slots)
+                    upd_idx.extend(idx)
+                ndof += node.ndofs
+
+        self.upd_rows = np.array(upd_rows, dtype=np.intp)
+        self.upd_cols = np.array(upd_cols, dtype=np.intp)
+        self.upd_idx  = np.array(upd_idx,  dtype=np.intp)
+
+    def isCurrent(self, elements, nodes=()):
+        r"""
+        :param elements: list of elements used to build this map
+        :param nodes: list of nodes used to build this map
+        :returns: **True** if no element or node was added and no node has changed its d.o.f. layout since this map was built.
+        """
+        return (self.revision == self.pool.token(self.rows)[0]
+                and self.nelem == len(elements)
+                and self.nnodes == len(nodes))
+
+    def updateDisp(self, dU):
+        r"""
+        Add the global displacement correction **dU** to the displacements of all nodes.
+
+        :param dU: global displacement correction vector
+        """
+        self.pool.update_disp(dU, self.upd_rows, self.upd_cols, self.upd_idx)
+
+        for node, idx in self.transformed:
+            node._updateDisp(dU[idx])
+
+    def asTuple(self):
+        r"""
+        :returns: the map arrays as tuple :code:`(elem_ptr, node_ptr, dof_rows, local_idx, cols)`
+        """
+        return (self.elem_ptr, self.node_ptr, self.dof_rows, self.local_idx, self.cols)
+
+    def elementIndex(self, global_idx, element):
+        r"""
+        :param global_idx: global d.o.f. indices of all elements, as returned by :py:meth:`gather`
+        :param element: an element included in this map
+        :returns: list of global index arrays, one for each node of **element**
+        """
+        e = self.elem_pos[element.ID]
+        node_ptr = self.node_ptr
+        return [ global_idx[node_ptr[k]:node_ptr[k+1]] for k in range(self.elem_ptr[e], self.elem_ptr[e+1]) ]
+
+    def gather(self, starts, elem_ids=None):
+        r"""
+        Global d.o.f. indices, displacements, and reference loads for a batch of elements.
+
+        :param starts: array of start indices in the global d.o.f. list by pool row
+        :param elem_ids: positions of the requested elements in the list used to build this map (default: all)
+        :returns: tuple :code:`(global_idx, u_e, f_e)` of stacked arrays (see :py:func:`gather_element_state`)
+        """
+        if elem_ids is None:
+            elem_ids = np.arange(self.elem_ptr.shape[0] - 1)
+
+        return gather_element_state(self.asTuple(),
+                                    self.pool.disps, self.pool.loads,
+                                    starts, np.asarray(elem_ids, dtype=np.intp))
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True, parallel=True)
+    def _gather_kernel(elem_ptr, node_ptr, dof_rows, local_idx, cols, disps, loads, starts, elem_ids, out_ptr):
+        n = out_ptr[-1]
+        global_idx = np.empty(n, dtype=np.intp)
+        u_e = np.empty(n)
+        f_e = np.empty(n)
+
+        for k in prange(elem_ids.shape[0]):
+            e   = elem_ids[k]
+            pos = out_ptr[k]
+            for p in range(node_ptr[elem_ptr[e]], node_ptr[elem_ptr[e+1]]):
+                row = dof_rows[p]
+                global_idx[pos] = starts[row] + local_idx[p]
+                u_e[pos] = disps[row, cols[p]]
+                f_e[pos] = loads[row, cols[p]]
+                pos += 1
+
+        return global_idx, u_e, f_e
+
+    @njit(cache=True)
+    def _gather_kernel_1d(U, idx, out):
+        for k in range(idx.shape[0]):
+            out[k] = U[idx[k]]
+        return out
+
+    @njit(cache=True)
+    def _scatter_add_kernel(target, idx, values):
+        for k in range(idx.shape[0]):
+            target[idx[k]] += values[k]
+
+
+def gather(U, idx, out=None):
+    r"""
+    Gather :code:`out[k] = U[idx[k]]`.
+
+    :param U: source vector
+    :param idx: integer index array
+    :param out: optional output array of the same length as **idx**
+    :returns: the gathered values (**out** if provided)
+    """
+    if out is None:
+        out = np.empty(len(idx), dtype=U.dtype)
+    if HAS_NUMBA:
+        return _gather_kernel_1d(U, idx, out)
+    return np.take(U, idx, out=out)
+
+
+def scatter_add(target, idx, values):
+    r"""
+    Accumulate :code:`target[idx[k]] += values[k]` in place.  Repeated indices accumulate.
+
+    :param target: vector to add to
+    :param idx: integer index array
+    :param values: values to be added, same length as **idx**
+    """
+    if HAS_NUMBA:
+        _scatter_add_kernel(target, idx, values)
+    else:
+        target += np.bincount(idx, weights=values, minlength=target.shape[0])
+
+
+def gather_element_state(dof_map_csr, disp_soa, loads_soa, start_offsets, elem_ids):
+    r"""
+    Gather global d.o.f. indices and nodal state for a batch of elements in one pass.
+
+    Results for all requested elements are stacked in the order of **elem_ids**.  The d.o.f.s of
+    element :code:`elem_ids[k]` occupy the range :code:`node_ptr[elem_ptr[e]]:node_ptr[elem_ptr[e+1]]`
+    shifted to the start of that element's block.
+
+    Uses a compiled kernel if :code:`numba` is available, and vectorized numpy otherwise.
+
+    :param dof_map_csr: tuple :code:`(elem_ptr, node_ptr, dof_rows, local_idx, cols)` (see :py:class:`DofMap`)
+    :param disp_soa: pool array of nodal displacements, :code:`NodePool.disps`
+    :param loads_soa: pool array of nodal reference loads, :code:`NodePool.loads`
+    :param start_offsets: start index in the global d.o.f. list by pool row
+    :param elem_ids: array of element positions
+    :returns: tuple :code:`(global_idx, u_e, f_e)` of global indices, displacements, and loads (global frame)
+    """
+    elem_ptr, node_ptr, dof_rows, local_idx, cols = dof_map_csr
+
+    first  = node_ptr[elem_ptr[elem_ids]]
+    counts = node_ptr[elem_ptr[elem_ids + 1]] - first
+
+    if HAS_NUMBA:
+        out_ptr = np.zeros(len(elem_ids) + 1, dtype=np.intp)
+        np.cumsum(counts, out=out_ptr[1:])
+        return _gather_kernel(elem_ptr, node_ptr, dof_rows, local_idx, cols,
+                              disp_soa, loads_soa, start_offsets, elem_ids, out_ptr)
+
+    # expand element ranges into a flat list of d.o.f. entries
+    offsets = np.cumsum(counts) - counts
+    p = np.repeat(first - offsets, counts) + np.arange(counts.sum())
+
+    rows = dof_rows[p]
+    global_idx = start_offsets[rows] + local_idx[p]
+    u_e = disp_soa[rows, cols[p]]
+    f_e = loads_soa[rows, cols[p]]
+
+    return global_idx, u_e, f_e
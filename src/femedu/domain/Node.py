@@ -1,8 +1,10 @@
 from copy import deepcopy
+from itertools import count
 
 import numpy as np
 from collections import deque
 
+from .NodePool import NodePool
 from ..elements import Element
 from ..recorder.Recorder import Recorder
 
@@ -10,49 +12,104 @@ class Node():
     r"""
     class: representing a single Node
 
+    Positions, displacements, loads, and fixities of all nodes are stored in
+    a shared :py:class:`NodePool` (:code:`Node.POOL`).  Each node owns one row of that pool,
+    which is released for reuse once the node is deleted.
+
+    Creating a :code:`Node` returns an instance of :py:class:`Node1D`, :py:class:`Node2D`, or :py:class:`Node3D`,
+    depending on the number of coordinates provided.
+
     :param x0: Initial position (List)
     """
-    COUNT = 0
+    POOL  = NodePool()   # contiguous storage for the state of all nodes
 
-    def __init__(self, x0, y0=None, z0=None):
-        self.ID = Node.COUNT
-        Node.COUNT += 1
+    _ID_GEN = count()    # source of unique node IDs
+
+    # shared initial values of _slots and _dof_slot; request() replaces them by per-node arrays
+    _NO_SLOTS = np.array([], dtype=int)
+    _NO_SLOTS.flags.writeable = False
+    _NO_TABLE = np.full(1, -1, dtype=np.int8)
+    _NO_TABLE.flags.writeable = False
 
+    __slots__ = ('ID', '_pool', '_row',
+                 'is_lead', 'lead', 'followers',
+                 'loadfactor', 'loadfactor_n', 'loadfactor_nn', 'disp_pushed',
+                 'ndofs', '_slots', '_dof_slot', '_scaled_loads', '_scaled_lam',
+                 'start', 'elements', '_setU', '_hasLoad', '_transform', 'dof_maps', '_col_maps',
+                 'recorder', '_mapped_variable', '_weighted_value', '_weight', '__weakref__')
+
+    _spatial_dim = None   # set by the dimension-specific subclasses
+
+    def __new__(cls, *args, **kwargs):
+        if cls is Node:
+            cls = Node._dimensionClass(*args, **kwargs)
+        return object.__new__(cls)
+
+    @staticmethod
+    def _dimensionClass(x0=None, y0=None, z0=None):
+        r"""
+        :returns: the node class matching the given coordinates (internal use)
+        """
         if isinstance(z0, (int, float)):
-            self.pos = np.array([x0, y0, z0])
+            return Node3D
         elif isinstance(y0, (int, float)):
-            self.pos = np.array([x0, y0])
+            return Node2D
         else:
-            self.pos = np.array([x0])
+            return Node1D
+
+    def __init__(self, x0, y0=None, z0=None):
+        self.ID = next(Node._ID_GEN)
+
+        if self._spatial_dim is None:   # subclass of Node without a fixed dimension
+            self._spatial_dim = Node._dimensionClass(x0, y0, z0)._spatial_dim
+
+        pos = (x0, y0, z0)[:self._spatial_dim]
+
+        self._pool = Node.POOL
+        self._row  = self._pool.register(pos, self)   # this node's row in the pool
 
         self.is_lead     = True   # is this a lead node?  Will be set to follower (is_lead = False) if tied
         self.lead        = self   # following yourself
         self.followers   = []     # list of following nodes
 
-        self.disp          = None   # active current displacement vector
-        self.disp_n        = None   # previously converged displacement vector
         self.loadfactor_n  = 0.0    # load factor for previously converged state
-        self.disp_nn       = None   # two steps back converged displacement vector
         self.loadfactor_nn = 0.0    # load factor for two steps back converged state
-        self.disp_mode     = None   # stored displacement representing a mode shape
         self.disp_pushed   = deque()   # stored displacement vector (see pushU() and popU())
 
-        self.dofs        = {}
         self.ndofs       = 0
+        self._slots      = Node._NO_SLOTS   # pool column for each local dof
+        self._dof_slot   = Node._NO_TABLE   # pool column -> local dof (-1: absent), see _dofTable()
+        self._scaled_loads = None          # cached getLoad(apply_load_factor=True), None if outdated
+        self._scaled_lam   = None          # load factor used for _scaled_loads
         self.start       = None
         self.elements    = []
-        self._fixity     = []  # list for dof keys for fixed dofs
         self._setU       = {}  # prescribed displacement parameters u0 and u1: u[dof] = u0 + loadfactor*u1
-        self.loads       = {}
         self._hasLoad    = False
         self._transform  = None    # nodal transformation object
         self.dof_maps    = {}      # dof_idx maps for attached elements
+        self._col_maps   = {}      # pool columns for attached elements
 
         self._resetGaussPointMap()
         self.setRecorder(None)
 
         self.setLoadFactor(1.0)
 
+    @staticmethod
+    def assign_ids(nodes, start=0):
+        r"""
+        Number the given nodes consecutively, e.g., after constructing a mesh.
+
+        .. note::
+
+            Newly created nodes continue to draw IDs from the global counter.
+            Renumbering may hence produce IDs that are already in use by other nodes.
+
+        :param nodes: list of nodes
+        :param start: ID of the first node in **nodes**
+        """
+        for i, node in enumerate(nodes, start):
+            node.ID = i
+
     def __str__(self):
         float_formatter = "{:.3f}".format
         np.set_printoptions(formatter={'float_kind': float_formatter})
@@ -65,10 +122,11 @@ class Node():
             s += f"\n    local: x={T[:,0]}, y={T[:,1]}"
             if T.shape[1]>2:
                 s += f", z={T[:,2]}"
-        if self._fixity:
-            s += f"\n    fix:  {self._fixity}"
+        fixity = self.getFixedDofs()
+        if fixity:
+            s += f"\n    fix:  {fixity}"
         load = self.getLoad()
-        if isinstance(load, np.ndarray) and not np.isclose(np.linalg.norm(load), 0.0):
+        if isinstance(load, np.ndarray) and np.abs(load).max(initial=0.0) > 1.0e-14:
             s += f"\n    P:    {load}"
         s += f"\n    u:    {self.disp}"
 
@@ -80,6 +138,33 @@ class Node():
     def __repr__(self):
         return "Node_{}(x={}, u={})".format(self.ID, self.pos, self.disp)
 
+    @property
+    def pos(self):
+        r"""
+        initial position vector (view on this node's row in the pool)
+        """
+        return self._pool.positions[self._row, :self._spatial_dim]
+
+    @property
+    def disp(self):
+        r"""
+        active current displacement vector, sorted as requested by the elements
+        """
+        return self._pool.disps[self._row, self._slots]
+
+    @disp.setter
+    def disp(self, U):
+        self._pool.disps[self._row, self._slots] = U
+        self._pool.touch(self._row)
+
+    @property
+    def loads(self):
+        r"""
+        nodal reference loads as a dictionary of :code:`{dof-code: load}`
+        """
+        pool = self._pool
+        return { dof:load for dof, load in zip(pool.dof_codes, pool.loads[self._row]) if load }
+
     def getID(self):
         r"""
         :returns: the node ID (``str``)
@@ -125,24 +210,33 @@ class Node():
         :param caller:  pointer to calling element (usually sent as self)
         """
         if self.is_lead:
-            dof_idx = []
-            for dof in dof_list:
-                if dof not in self.dofs:
-                    self.dofs[dof] = self.ndofs
+            dof_idx = np.empty(len(dof_list), dtype=np.int32)
+            for k, dof in enumerate(dof_list):
+                col   = self._pool.slot(dof)
+                table = self._dofTable()
+                idx   = table[col]
+                if idx < 0:
+                    idx = self.ndofs
+                    table[col] = idx
                     self.ndofs += 1
-                dof_idx.append(self.dofs[dof])
+                    self._slots = np.append(self._slots, col)
+                    self._scaled_loads = None
+                dof_idx[k] = idx
+
+            self._pool.touch_layout(self._row)
 
             if caller not in self.elements:
                 self.elements.append(caller)
 
             # remember the dof_idx map for this element for future interaction
-            self.dof_maps[caller] = dof_idx
+            self.dof_maps[caller]  = dof_idx
+            self._col_maps[caller] = self._slots[dof_idx]
 
             # let any attached transformation know that the nodal dof-list has changed.
             if self._transform:
                 self._transform.refreshMaps()
 
-            return tuple(dof_idx)
+            return tuple(dof_idx.tolist())
 
         else:
             return self.lead.request(dof_list=dof_list, caller=caller)
@@ -160,8 +254,8 @@ class Node():
         if self.is_lead:
             for dof in dofs:
                 if isinstance(dof, str):
-                    if dof not in self._fixity:
-                        self._fixity.append(dof)
+                    col = self._pool.slot(dof)   # may add a column to the pool
+                    self._pool.fixity[self._row, col] = True
                 elif isinstance(dof,list) or isinstance(dof,tuple):
                     for item in dof:
                         self.fixDOF(item)
@@ -170,12 +264,57 @@ class Node():
         else:
             self.lead.fixDOF(*dofs)
 
+    @property
+    def dofs(self):
+        r"""
+        dictionary of requested d.o.f.s mapping dof-code to local index (read-only)
+        """
+        codes = self._pool.dof_codes
+        return { codes[col]:k for k, col in enumerate(self._slots) }
+
+    def _dofTable(self):
+        r"""
+        :returns: table of local dof indices by pool column (internal use)
+
+        The last entry is always -1 and serves as target for dof-codes unknown to the pool.
+        """
+        ncols = len(self._pool.dof_codes)
+        if self._dof_slot.shape[0] <= ncols:
+            table = np.full(ncols + 1, -1, dtype=np.int8)
+            table[:self._dof_slot.shape[0] - 1] = self._dof_slot[:-1]
+            self._dof_slot = table
+        return self._dof_slot
+
+    def _localIndex(self, dof):
+        r"""
+        :param dof: a dof-code
+        :returns: local index of **dof**, or -1 if **dof** is not present at this node (internal use)
+        """
+        col = self._pool.slots.get(dof)
+        if col is None:
+            return -1
+        try:
+            return self._dof_slot.item(col)
+        except IndexError:   # column added to the pool after this node's last request()
+            return -1
+
+    def _dofIndex(self, dofs):
+        r"""
+        :param dofs: list of dof-codes
+        :returns: array of local indices for **dofs**.  Entries for dofs not present at this node are -1. (internal use)
+        """
+        table = self._dofTable()
+        slots = self._pool.slots
+        ncols = table.shape[0] - 1
+        cols  = np.fromiter((slots.get(dof, ncols) for dof in dofs), dtype=np.intp, count=len(dofs))
+        return table[cols].astype(np.int32)
+
     def hasDOF(self, dof):
         """
         :param dof: a dof string ID
         :return: True(False) if dof in(not in) the node's dof-list
         """
-        return (dof in self.dofs)
+        return self._localIndex(dof) >= 0
 
     def setDOF(self, dofs=[], values=[]):
         r"""
@@ -235,7 +374,8 @@ class Node():
         :param dof: dof code as defined in :code:`request()`
         """
         if self.is_lead:
-            return (dof in self._fixity)
+            col = self._pool.slots.get(dof)
+            return col is not None and self._pool.fixity.item(self._row, col)
         else:
             return self.lead.isFixed(dof)
 
@@ -245,12 +385,12 @@ class Node():
 
         return a list of indices pointing to fixed dofs in this node.
         Indices are local to this node: :code:`0..num_dofs`
+
+        :returns: array of the local indices of all fixed dofs, e.g., :code:`[1]` if only the second
+                  requested dof is fixed.
         """
         if self.is_lead:
-            idx = []
-            for i,dof in enumerate(self._fixity):
-                idx.append(i)
-            return np.array(idx, dtype=int)
+            return np.flatnonzero(self._pool.fixed(self._row, self._slots))
         else:
             return self.lead.areFixed()
 
@@ -260,7 +400,9 @@ class Node():
         :returns: a list of fixed dofs by dof-code strings.
         """
         if self.is_lead:
-            return self._fixity[:]
+            pool = self._pool
+            fixed = pool.fixity[self._row]
+            return [ dof for k, dof in enumerate(pool.dof_codes) if fixed[k] ]
         else:
             return self.lead.getFixedDofs()
 
@@ -283,21 +425,19 @@ class Node():
             if isinstance(U,list) or isinstance(U,tuple):
                 U = np.array(U)
 
+            target = self._pool.displacements(modeshape)
+
             if dof_list:
-                for ui, dof in zip(U, dof_list):
-                    if dof in self.dofs:
-                        if modeshape:
-                            self.disp_mode[self.dofs[dof]] = ui
-                        else:
-                            self.disp[self.dofs[dof]] = ui
-                    else:
-                        msg = f"requested dof:{dof} not present at current node.  Available dofs are {self.dofs.keys()}"
-                        raise TypeError(msg)
+                idx = self._dofIndex(dof_list)
+                if np.any(idx < 0):
+                    dof = dof_list[int(np.argmin(idx))]
+                    msg = f"requested dof:{dof} not present at current node.  Available dofs are {self.dofs.keys()}"
+                    raise TypeError(msg)
+                target[self._row, self._slots[idx]] = U[:len(idx)]
             else:
-                if modeshape:
-                    self.disp_mode = U
-                else:
-                    self.disp = U
+                target[self._row, self._slots] = U
+
+            self._pool.touch(self._row)
 
         else:
             self.lead.setDisp(U, dof_list=dof_list, modeshape=modeshape)
@@ -311,9 +451,10 @@ class Node():
         if self.is_lead:
 
             if self._transform:
-                self.disp += self.v2g(dU, self)
-            else:
-                self.disp += dU
+                dU = self.v2g(dU, self)
+
+            self._pool.disps[self._row, self._slots] += dU
+            self._pool.touch(self._row)
 
         """
         Do not forward that call to the lead node or that increment will be duplicated.
@@ -358,68 +499,49 @@ class Node():
         :return: nodal displacement vector
         """
         if self.is_lead:
-            if 'modeshape' in kwargs and kwargs['modeshape']:
-                if not isinstance(self.disp_mode, np.ndarray):
-                    self.disp_mode = np.zeros(self.ndofs)
-                U = self.disp_mode
+            pool = self._pool
+
+            if 'modeshape' in kwargs:
+                U = pool.displacements(kwargs['modeshape'])[self._row]
             else:
-                if not isinstance(self.disp, np.ndarray):
-                    self.disp = np.zeros(self.ndofs)
-                    self.disp_n = np.zeros(self.ndofs)
-                    self.disp_nn = np.zeros(self.ndofs)
-                U = self.disp
+                U = pool.disps[self._row]
 
-            # so far, U is in global coordinates.
+            # so far, U is the full pool row in global coordinates.
             # see if local coordinates were requested
-            if 'local' in kwargs and kwargs['local'] == True:
-                # check if we have a nodal transformation attached
-                # if isinstance(self._transform, Transformation):
-                if self._transform:
-                    #
-                    # see Element.getLoad() and Element.getForce() methods
-                    #
-                    U = self.v2l(U, self)
-
-            # *** the following code segment was moved to Node.getFixedDisp(...)
+            if 'local' in kwargs and kwargs['local'] == True and self._transform:
+                #
+                # see Element.getLoad() and Element.getForce() methods
+                #
+                Ulocal = np.zeros_like(U)
+                Ulocal[self._slots] = self.v2l(U[self._slots], self)
+                U = Ulocal
+
+            # *** prescribed displacements are handled by Node.getFixedDisp(...)
             # *** this will be used inside Solver and classes derived from it.
 
-            # # apply prescribed displacements
-            # for dof in self._setU:
-            #     if dof in self.dofs:
-            #         # the index of dof in self.U
-            #         idx = self.dofs[dof]
-            #         # the prescribed displacement value
-            #         ubar = self._setU[dof][0] + self.loadfactor * self._setU[dof][1]
-            #         # set prescribed value in nodal U-vector
-            #         U[idx] = ubar
-
             if caller:
                 # we know the calling element.
                 # ... ignoring dofs and using dof list from element map
 
-                if caller not in self.dof_maps:
+                cols = self._col_maps.get(caller)
+                if cols is None:
                     msg = "caller not registered with this node"
                     raise TypeError(msg)
 
-                idx = self.dof_maps[caller]
-                ans = U[idx]
-                return np.array(ans)
+                return U[cols]
 
             else:
                 # we do not know who is requesting displacements, so provide all requested or ALL if no dofs were specified.
                 if dofs:
                     if isinstance(dofs, str):
-                        dofs = [dofs]
-                    ans = []
-                    for dof in dofs:
-                        if dof in self.dofs:
-                            ans.append(U[self.dofs[dof]])
-                        else:
-                            ans.append(0.0)
+                        dofs = (dofs,)
+                    # pool columns of dofs not requested by this node hold zeros
+                    cols, known = pool.selector(tuple(dofs))
+                    if known:
+                        return U[cols]
+                    return np.where(cols >= 0, U[cols], 0.0)
                 else:
-                    ans = U
-
-                return np.array(ans)
+                    return U[self._slots]
 
         else:
             return self.lead.getDisp(dofs=dofs, caller=caller, **kwargs)
@@ -448,9 +570,9 @@ class Node():
 
             # apply prescribed displacements
             for dof in self._setU:
-                if dof in self.dofs:
-                    # the index of dof in self.U
-                    idx = self.dofs[dof]
+                # the index of dof in self.U
+                idx = self._dofIndex((dof,))[0]
+                if idx >= 0:
                     # the prescribed displacement value
                     ubar = self._setU[dof][0] + self.loadfactor * self._setU[dof][1]
                     # set prescribed value in nodal U-vector
@@ -475,25 +597,20 @@ class Node():
                     msg = "caller not registered with this node"
                     raise TypeError(msg)
 
-                idx = self.dof_maps[caller]
-                ans = U[idx]
-                return np.array(ans)
+                return U.take(self.dof_maps[caller])
 
             else:
                 # we do not know who is requesting displacements, so provide all requested or ALL if no dofs were specified.
                 if dofs:
                     if isinstance(dofs, str):
                         dofs = [dofs]
-                    ans = []
-                    for dof in dofs:
-                        if dof in self.dofs:
-                            ans.append(U[self.dofs[dof]])
-                        else:
-                            ans.append(0.0)
+                    idx = self._dofIndex(dofs)
+                    ans = np.zeros(len(idx))
+                    ans[idx >= 0] = U[idx[idx >= 0]]
                 else:
                     ans = U
 
-                return np.array(ans)
+                return ans
 
         else:
             return self.lead.getFixedDisp(dofs=dofs, caller=caller, **kwargs)
@@ -504,11 +621,12 @@ class Node():
         :return: delta u = (current u) - (last converged u)
         """
         if self.is_lead:
+            pool = self._pool
             if previous_step:
-                dU = self.disp_n - self.disp_nn
+                dU = pool.disps_n[self._row] - pool.disps_nn[self._row]
             else:
-                dU = self.disp - self.disp_n
-            return dU
+                dU = pool.disps[self._row] - pool.disps_n[self._row]
+            return dU[self._slots]
         else:
             return self.lead.getDeltaU(previous_step=previous_step)
 
@@ -541,45 +659,12 @@ class Node():
         :param factor: deformation magnification factor, :math:`f`.
         :return: deformed position vector, :math:`{\bf x}`.
         """
-        if self.is_lead:
-            if self.pos.shape[0] == 1:
-                my_dofs = ('ux',)
-            elif self.pos.shape[0] == 2:
-                my_dofs = ('ux','uy')
-            elif self.pos.shape[0] == 3:
-                my_dofs = ('ux','uy','uz')
-            else:  # don't know what that would be
-                msg = f"Don't know how to interprete position: {self.pos}"
-                raise TypeError(msg)
-
-            if 'modeshape' in kwargs and kwargs['modeshape']:
-                if not isinstance(self.disp_mode, np.ndarray):
-                    self.disp_mode = np.zeros(self.ndofs)
+        pool = self._pool
 
-                return self.pos + factor * self.getDisp(caller=None, dofs=my_dofs, modeshape=1)
-            else:
-                if not isinstance(self.disp, np.ndarray):
-                    self.disp    = np.zeros(self.ndofs)
-                    self.disp_n  = np.zeros(self.ndofs)
-                    self.disp_nn = np.zeros(self.ndofs)
-
-                return self.pos + factor * self.getDisp(caller=None, dofs=my_dofs)
-
-        else:
-            if self.pos.shape[0] == 1:
-                my_dofs = ('ux',)
-            elif self.pos.shape[0] == 2:
-                my_dofs = ('ux','uy')
-            elif self.pos.shape[0] == 3:
-                my_dofs = ('ux','uy','uz')
-            else:  # don't know what that would be
-                msg = f"Don't know how to interprete position: {self.pos}"
-                raise TypeError(msg)
-
-            #return self.lead.getDeformedPos(caller=caller, factor=factor, **kwargs)
-            disp = self.lead.getDisp(dofs=my_dofs, caller=None, factor=factor, **kwargs)
+        U = pool.displacements(kwargs.get('modeshape', False))
 
-            return self.pos + factor * disp
+        # followers use the displacement of their lead node
+        return self.pos + factor * U[pool.lead[self._row], :self._spatial_dim]
 
     def getIdx4Element(self, elem):
         r"""
@@ -592,7 +677,7 @@ class Node():
                     return self.getIdx4DOFs()
                 else:
                     # use the subset of dofs used by this element
-                    return self.start + np.array(self.dof_maps[elem], dtype=int)
+                    return self.start + self.dof_maps[elem]
             else:
                 msg = f"Element {elem} not in dof_map for node {self.ID}"
                 raise TypeError(msg)
@@ -611,17 +696,14 @@ class Node():
         if self.is_lead:
 
             if not dofs:
-                dofs = self.dofs.keys()
-
-            idx = []
-            for dof in dofs:
-                if dof in self.dofs:
-                    idx.append(self.dofs[dof])
-                else:
+                ans = np.arange(self.ndofs, dtype=np.int32)
+            else:
+                ans = self._dofIndex(dofs)
+                if np.any(ans < 0):
+                    dof = list(dofs)[int(np.argmin(ans))]
                     msg = f"dof {dof} not present at node {self.ID}"
                     raise TypeError(msg)
 
-            ans = np.array(idx, dtype=int)
             if not local:
                 ans += self.start
 
@@ -654,6 +736,7 @@ class Node():
         if isinstance(T, Transformation):
             T.registerClient(self) # register this Node with the transformation
             self._transform = T
+            self._pool.touch_layout(self._row)
 
     def addLoad(self, loads, dofs):
         r"""
@@ -672,26 +755,46 @@ class Node():
         :type dofs: list of dof-codes
         """
         if self.is_lead:
-            # Check tuple type and if the dof exists (warn and continue)
-            for (load, dof) in zip(loads, dofs):
-                if dof in self.loads:
-                    self.loads[dof] += load
-                else:
-                    self.loads[dof] = load
-            self._hasLoad = True
+            loads, cols = self._loadColumns(loads, dofs)
+            self.addLoadVec(loads, cols)
         else:
             self.lead.addLoad(loads, dofs)
 
+    def addLoadVec(self, f, dof_slots):
+        r"""
+        Add a load vector to the nodal loads in a single scatter operation.
+
+        :param f: array of load components
+        :param dof_slots: array of pool columns associated with **f**, e.g., :code:`[Node.POOL.slot(dof) for dof in dofs]`
+        """
+        if self.is_lead:
+            np.add.at(self._pool.loads[self._row], dof_slots, f)
+            self._hasLoad = True
+            self._scaled_loads = None
+        else:
+            self.lead.addLoadVec(f, dof_slots)
+
+    def _loadColumns(self, loads, dofs):
+        r"""
+        translate dof-codes into pool columns (internal use)
+
+        :returns: tuple (load array, column array) of matching length
+        """
+        cols  = np.array([ self._pool.slot(dof) for dof in dofs ], dtype=np.intp)
+        loads = np.asarray(list(loads), dtype=float)
+        n = min(len(loads), len(cols))
+        return loads[:n], cols[:n]
+
     def setLoad(self, loads, dofs):
         r"""
         :param loads: list of force components
         :param dofs:  associated list of DOFs to which respective loads are to be applied
         """
         if self.is_lead:
-            # Check tuple type and if the dof exists (warn and continue)
-            for (load, dof) in zip(loads, dofs):
-                self.loads[dof] = load
+            loads, cols = self._loadColumns(loads, dofs)
+            self._pool.loads[self._row, cols] = loads
             self._hasLoad = True
+            self._scaled_loads = None
         else:
             self.lead.setLoad(loads, dofs)
 
@@ -700,8 +803,9 @@ class Node():
         Resets the load vectors
         """
         if self.is_lead:
-            self.loads = {}
+            self._pool.loads[self._row] = 0.0
             self._hasLoad = False
+            self._scaled_loads = None
         else:
             self.lead.resetLoad()
 
@@ -712,23 +816,24 @@ class Node():
         :returns: nodal load vector (ndarray)
         """
         if self.is_lead:
+            P = self._pool.loads[self._row]
             if dof_list:
-                force = np.zeros(len(dof_list))
-                for dof in dof_list:
-                    if (dof in self.loads) and (dof in self.dofs):
-                            idx = dof_list.index(dof)
-                            if apply_load_factor:
-                                force[idx] = self.loads[dof] * self.loadfactor
-                            else:
-                                force[idx] = self.loads[dof]
+                idx   = self._dofIndex(dof_list)
+                force = np.zeros(len(idx))
+                force[idx >= 0] = P[self._slots[idx[idx >= 0]]]
+
+                if apply_load_factor:
+                    force *= self.loadfactor
+
+            elif apply_load_factor:
+                # scaled loads change only with the loads or the load factor
+                if self._scaled_loads is None or self._scaled_lam != self.loadfactor:
+                    self._scaled_loads = P[self._slots] * self.loadfactor
+                    self._scaled_lam   = self.loadfactor
+                force = self._scaled_loads
+
             else:
-                force = np.zeros(self.ndofs)
-                for dof in self.loads:
-                    if dof in self.dofs:
-                        if apply_load_factor:
-                            force[self.dofs[dof]] = self.loads[dof] * self.loadfactor
-                        else:
-                            force[self.dofs[dof]] = self.loads[dof]
+                force = P[self._slots]
         else:
             force = self.lead.getLoad(dof_list=dof_list, apply_load_factor=apply_load_factor)
 
@@ -748,9 +853,11 @@ class Node():
         Resets the displacement vector.
         """
         if self.is_lead:
-            self.disp_nn = np.zeros(len(self.dofs))
-            self.disp_n  = np.zeros(len(self.dofs))
-            self.disp    = np.zeros(len(self.dofs))
+            pool = self._pool
+            pool.disps_nn[self._row] = 0.0
+            pool.disps_n[self._row]  = 0.0
+            pool.disps[self._row]    = 0.0
+            pool.touch(self._row)
         else:
             self.lead.resetDisp()
 
@@ -855,10 +962,10 @@ class Node():
         """
         if self.is_lead:
             # rotate states (n)->(n-1) and current->(n)
-            if isinstance(self.disp_n, np.ndarray):
-                self.disp_nn = self.disp_n.copy()
-            if isinstance(self.disp, np.ndarray):
-                self.disp_n  = self.disp.copy()
+            pool = self._pool
+            pool.disps_nn[self._row] = pool.disps_n[self._row]
+            pool.disps_n[self._row]  = pool.disps[self._row]
+            pool.touch(self._row)
             self.loadfactor_nn = self.loadfactor_n
             self.loadfactor_n  = self.loadfactor
 
@@ -879,6 +986,7 @@ class Node():
         """
 
         self.lead = lead
+        self._pool.touch_layout([self._row, lead._row])
 
         if self == lead:
             self.is_lead = True
@@ -889,20 +997,38 @@ class Node():
         # transfer element maps
         for elem in self.dof_maps:
             elem_dof_map = []
-            for dof in self.dofs:
-                idx = self.dofs[dof]
+            for dof, idx in self.dofs.items():
                 if idx in self.dof_maps[elem]:
                     elem_dof_map.append(dof)
             lead.request(elem_dof_map, elem)
 
+        # the pool refers to the final lead node in a chain of ties
+        root = lead
+        while not root.is_lead:
+            root = root.lead
+        self._setLeadRow(root._row)
+
+        pool = self._pool
+
         # transfer nodal loads
-        if self._hasLoad:
-            self.lead.addLoad(self.loads.values(), self.loads.keys())
-            self.loads = {}
+        if self._hasLoad and not self.is_lead:
+            pool.loads[root._row] += pool.loads[self._row]
+            pool.loads[self._row]  = 0.0
+            root._hasLoad = True
             self._hasLoad = False
+            root._scaled_loads = None
+            self._scaled_loads = None
 
         # transfer fixities
-        self.lead.fixDOF(self._fixity)
+        pool.fixity[root._row] |= pool.fixity[self._row]
+
+    def _setLeadRow(self, row):
+        r"""
+        point the pool entries of this node and all of its followers to the lead node in **row** (internal use)
+        """
+        self._pool.lead[self._row] = row
+        for follower in self.followers:
+            follower._setLeadRow(row)
 
     def addFollower(self, follower):
         if follower in self.followers:
@@ -923,7 +1049,9 @@ class Node():
         This should be used by a solution algorithm but not by regular
         user input.
         """
-        self.disp       = 2.0 * self.disp_n - self.disp_nn
+        pool = self._pool
+        pool.disps[self._row] = 2.0 * pool.disps_n[self._row] - pool.disps_nn[self._row]
+        pool.touch(self._row)
         self.loadfactor = 2.0 * self.loadfactor_n - self.loadfactor_nn
 
     #
@@ -933,7 +1061,7 @@ class Node():
     def hasTransform(self):
         return (self._transform != None)
 
-    def v2l(self, U, caller=None):
+    def v2l(self, U, caller=None, out=None):
         """
         transform a nodal vector from global to local coordinates
 
@@ -942,8 +1070,20 @@ class Node():
 
         :param U: vector to be transformed
         :param caller: pointer to the calling element
-        :return: the transformed vector
+        :param out: optional array receiving the transformed vector.  It is used only if its shape
+                    matches the result, e.g., not for a transformed node returning all of its d.o.f.s.
+        :return: the transformed vector (**out** if used)
         """
+        if out is not None:
+            if self.is_lead and not self._transform:
+                Ulocal = U
+            else:
+                Ulocal = self.v2l(U, caller=caller)
+            if np.shape(Ulocal) != out.shape:
+                return Ulocal
+            out[...] = Ulocal
+            return out
+
         if self.is_lead:
 
             if self._transform:
@@ -996,6 +1136,20 @@ class Node():
         else:
             return self.lead.v2g(U, caller=caller)
 
+    def getTransformMatrix(self):
+        r"""
+        :returns: the [ndof x ndof] matrix :math:`{\bf Q}` of this node such that
+                  :code:`m2l(M)` equals :math:`{\bf Q} \: {\bf M}` for a full nodal matrix :math:`{\bf M}`,
+                  or **None** if this node has no transformation.
+        """
+        if self.is_lead:
+            if self._transform:
+                return self._transform.m2l(np.identity(self.ndofs), self)
+            return None
+
+        else:
+            return self.lead.getTransformMatrix()
+
     def m2l(self, M, caller=None):
         """
         transform a nodal matrix from global to local coordinates
@@ -1100,3 +1254,27 @@ class Node():
             return ans
         else:
             return self.lead.getMappedValue(var)
+
+
+class Node1D(Node):
+    r"""
+    class: a :py:class:`Node` with one spatial coordinate, :math:`x`
+    """
+    __slots__ = ()
+    _spatial_dim = 1
+
+
+class Node2D(Node):
+    r"""
+    class: a :py:class:`Node` with two spatial coordinates, :math:`(x,y)`
+    """
+    __slots__ = ()
+    _spatial_dim = 2
+
+
+class Node3D(Node):
+    r"""
+    class: a :py:class:`Node` with three spatial coordinates, :math:`(x,y,z)`
+    """
+    __slots__ = ()
+    _spatial_dim = 3
@@ -0,0 +1,353 @@
+import weakref
+
+import numpy as np
+
+DOF_CODES = ('ux', 'uy', 'uz', 'rx', 'ry', 'rz')   # canonical order of d.o.f.-codes
+
+
+class NodePool():
+    r"""
+    class: contiguous storage for the state of all nodes (structure of arrays)
+
+    Every :py:class:`Node` registers with a pool upon construction and receives a row index.
+    All nodal state vectors are stored in that row using a fixed column for every d.o.f.-code.
+    Columns follow the canonical order :code:`('ux','uy','uz','rx','ry','rz')`.  Any other
+    d.o.f.-code, e.g., the temperature :code:`'T'` used by diffusion elements, receives an
+    additional column the first time it is used.
+
+    Columns for d.o.f.s that have not been requested by a node remain zero.  Hence, operations
+    on entire rows (or the entire pool) are safe.  Arrays are allocated with spare rows and columns;
+    only the first :code:`count` rows and :code:`len(dof_codes)` columns are in use.
+
+    The pool holds a weak reference to the node owning each row.  Rows of nodes that are no longer
+    referenced are released by :py:meth:`collect` and reused by new nodes, so a long-running process
+    does not accumulate the nodes of earlier models.  :py:meth:`register` collects before growing the pool.
+
+    Changes are tracked per row: :code:`revision` and :code:`state` are clocks that advance with
+    every change of a d.o.f. layout or of nodal displacements, and **layout_stamp** and **state_stamp**
+    record the clock value of the last change of every row.  Caches depending on a group of nodes
+    compare :py:meth:`token` for their rows, and are not affected by changes to other models.
+
+    .. list-table:: pool arrays
+        :header-rows: 1
+
+        * - name
+          - shape
+          - description
+        * - **positions**
+          - (N,3)
+          - initial nodal positions (padded by zeros for 1d and 2d nodes)
+        * - **spatial_dim**
+          - (N,)
+          - number of coordinates used by each node (1, 2, or 3)
+        * - **lead**
+          - (N,)
+          - row of the lead node (nodes lead themselves unless tied)
+        * - **disps**
+          - (N,ncols)
+          - active current displacement vectors
+        * - **disps_n**
+          - (N,ncols)
+          - previously converged displacement vectors
+        * - **disps_nn**
+          - (N,ncols)
+          - two steps back converged displacement vectors
+        * - **disp_modes**
+          - (N,ncols)
+          - stored displacements representing a mode shape
+        * - **loads**
+          - (N,ncols)
+          - nodal reference loads
+        * - **fixity**
+          - (N,ncols)
+          - **True** for restrained d.o.f.s
+        * - **active**
+          - (N,)
+          - **True** for rows in use by a node
+        * - **layout_stamp**
+          - (N,)
+          - value of :code:`revision` at the last change of the d.o.f. layout of a row
+        * - **state_stamp**
+          - (N,)
+          - value of :code:`state` at the last change of the displacements of a row
+
+    :param capacity: initial number of rows.  The pool grows as needed.
+    """
+
+    STATE = ('disps', 'disps_n', 'disps_nn', 'disp_modes', 'loads')   # float arrays of shape (N,ncols)
+
+    def __init__(self, capacity=64):
+        self.dof_codes = list(DOF_CODES)
+        self.slots     = { dof:k for k, dof in enumerate(self.dof_codes) }   # dof-code -> column
+
+        self.count    = 0   # number of rows used so far (including released rows)
+        self.capacity = capacity
+        self.revision = 0   # incremented whenever a node changes its d.o.f. layout
+        self.state    = 0   # incremented whenever nodal displacements change
+        self._selectors = {}   # cached column selectors by dof-tuple (see selector())
+        self._free      = []   # released rows available for reuse
+        self._owners    = []   # weak reference to the node owning each row (None if released)
+
+        ncols = 2 * len(self.dof_codes)   # spare columns for additional dof-codes
+
+        self.positions    = np.zeros((capacity, 3))
+        self.spatial_dim  = np.zeros(capacity, dtype=np.int8)
+        self.lead         = np.arange(capacity)
+        self.active       = np.zeros(capacity, dtype=bool)
+        self.layout_stamp = np.zeros(capacity, dtype=np.int64)
+        self.state_stamp  = np.zeros(capacity, dtype=np.int64)
+
+        for name in self.STATE:
+            setattr(self, name, np.zeros((capacity, ncols)))
+        self.fixity = np.zeros((capacity, ncols), dtype=bool)
+
+    def __len__(self):
+        return self.count - len(self._free)
+
+    def __repr__(self):
+        return "NodePool(nodes={}, dofs={})".format(len(self), self.dof_codes)
+
+    def register(self, pos, owner=None):
+        r"""
+        Add a new node to the pool.
+
+        :param pos: initial position of the node (1, 2, or 3 coordinates)
+        :param owner: the node using that row.  The row is released once **owner** is deleted (see :py:meth:`collect`).
+        :returns: row index assigned to the node (``int``)
+        """
+        if not self._free and self.count == self.capacity:
+            self.collect()
+
+        if self._free:
+            row = self._free.pop()
+        else:
+            if self.count == self.capacity:
+                self._grow_rows()
+            row = self.count
+            self.count += 1
+            self._owners.append(None)
+
+        ndim = len(pos)
+        self.positions[row, :ndim] = pos
+        self.spatial_dim[row] = ndim
+        self.active[row] = True
+        if owner is not None:
+            self._owners[row] = weakref.ref(owner)
+
+        return row
+
+    def collect(self):
+        r"""
+        Release the rows of all deleted nodes.
+
+        :returns: number of released rows
+        """
+        dead = [ row for row, ref in enumerate(self._owners) if ref is not None and ref() is None ]
+        for row in dead:
+            self.release(row)
+        return len(dead)
+
+    def release(self, row):
+        r"""
+        Clear a row and make it available for reuse.
+
+        :param row: pool row of a deleted node
+        """
+        self._owners[row] = None
+        self.positions[row]   = 0.0
+        self.spatial_dim[row] = 0
+        self.lead[row]        = row
+        for name in self.STATE:
+            getattr(self, name)[row] = 0.0
+        self.fixity[row] = False
+        self.active[row] = False
+        self.touch_layout(row)
+        self.touch(row)
+
+        self._free.append(row)
+
+    def touch(self, rows):
+        r"""
+        Record a change of the displacements of **rows**.
+
+        :param rows: pool row(s)
+        """
+        self.state += 1
+        self.state_stamp[rows] = self.state
+
+    def touch_layout(self, rows):
+        r"""
+        Record a change of the d.o.f. layout (requested d.o.f.s, lead node, transformation) of **rows**.
+
+        :param rows: pool row(s)
+        """
+        self.revision += 1
+        self.layout_stamp[rows] = self.revision
+
+    def token(self, rows):
+        r"""
+        :param rows: pool rows of a group of nodes, e.g., the nodes of an element
+        :returns: tuple :code:`(layout, state)` of clock values.  The tuple changes whenever any of these
+                  nodes or their lead nodes changes its d.o.f. layout or displacements.
+        """
+        lead   = self.lead[rows]
+        layout = max(self.layout_stamp[rows].max(initial=0), self.layout_stamp[lead].max(initial=0))
+        return (int(layout), int(self.state_stamp[lead].max(initial=0)))
+
+    def tokens(self, rows):
+        r"""
+        Vectorized :py:meth:`token` for many groups of nodes of equal size.
+
+        :param rows: array of pool rows of shape (ngroups, nnodes)
+        :returns: list of :code:`(layout, state)` tuples, one per group
+        """
+        lead   = self.lead[rows]
+        layout = np.maximum(self.layout_stamp[rows].max(axis=1), self.layout_stamp[lead].max(axis=1))
+        state  = self.state_stamp[lead].max(axis=1)
+        return list(zip(layout.tolist(), state.tolist()))
+
+    def slot(self, dof):
+        r"""
+        :param dof: a dof-code
+        :returns: the column used for **dof**.  Unknown dof-codes are assigned a new column.
+        """
+        if dof not in self.slots:
+            self.slots[dof] = len(self.dof_codes)
+            self.dof_codes.append(dof)
+            if len(self.dof_codes) > self.fixity.shape[1]:
+                self._grow_slots()
+            self._selectors = {}
+
+        return self.slots[dof]
+
+    def displacements(self, modeshape=False):
+        r"""
+        :param modeshape: set to **True** to select the stored mode shapes
+        :returns: the pool array holding current displacements (or mode shapes)
+        """
+        if modeshape:
+            return self.disp_modes
+        return self.disps
+
+    def selector(self, dofs):
+        r"""
+        :param dofs: tuple of dof-codes
+        :returns: tuple :code:`(cols, known)`: array of pool columns for **dofs** (-1 for dof-codes unknown
+                  to the pool), and **True** if all dof-codes are known.
+                  Selectors are computed once per tuple and reused.
+        """
+        sel = self._selectors.get(dofs)
+        if sel is None:
+            cols = np.array([ self.slots.get(dof, -1) for dof in dofs ], dtype=np.intp)
+            sel  = (cols, bool(np.all(cols >= 0)))
+            self._selectors[dofs] = sel
+        return sel
+
+    def update_disp(self, dU, rows, cols, idx):
+        r"""
+        Add a global displacement correction to the displacements of many nodes in a single operation.
+
+        :param dU: global displacement correction vector
+        :param rows: pool row for each updated d.o.f.
+        :param cols: pool column for each updated d.o.f.
+        :param idx: position of each updated d.o.f. in **dU**
+        """
+        self.disps[rows, cols] += dU[idx]
+        self.touch(rows)
+
+    def fixed(self, rows, cols):
+        r"""
+        Vectorized fixity test.
+
+        :param rows: pool rows
+        :param cols: pool columns (broadcast against **rows**)
+        :returns: boolean array, **True** where the d.o.f. in column **cols** of node **rows** is restrained
+        """
+        return self.fixity[rows, cols]
+
+    def deformed_positions(self, factor=1.0, modeshape=False, rows=None):
+        r"""
+        Deformed positions :math:`{\bf x} = {\bf X} + f \: {\bf u}` for many nodes in a single array operation.
+
+        Nodes tied to a lead node use the displacement of their lead node.
+
+        :param factor: deformation magnification factor, :math:`f`.
+        :param modeshape: set to **True** to use the stored mode shape instead of the current displacements.
+        :param rows: pool rows of the requested nodes (default: all nodes in use)
+        :returns: array of deformed positions, one row per node (``np.ndarray``)
+        """
+        if rows is None:
+            self.collect()
+            rows = np.flatnonzero(self.active[:self.count])
+
+        U = self.displacements(modeshape)
+
+        ndim = self.spatial_dim[rows].max(initial=1)
+
+        # the first columns hold ux, uy, uz (canonical order)
+        return self.positions[rows, :ndim] + factor * U[self.lead[rows], :ndim]
+
+    def _grow_rows(self):
+        r"""
+        double the number of available rows (internal use)
+        """
+        n = self.capacity
+
+        self.positions   = np.vstack((self.positions, np.zeros_like(self.positions)))
+        self.spatial_dim = np.concatenate((self.spatial_dim, np.zeros_like(self.spatial_dim)))
+        self.lead        = np.concatenate((self.lead, n + np.arange(n)))
+        self.active      = np.concatenate((self.active, np.zeros_like(self.active)))
+        self.layout_stamp = np.concatenate((self.layout_stamp, np.zeros_like(self.layout_stamp)))
+        self.state_stamp  = np.concatenate((self.state_stamp, np.zeros_like(self.state_stamp)))
+
+        for name in self.STATE:
+            A = getattr(self, name)
+            setattr(self, name, np.vstack((A, np.zeros_like(A))))
+        self.fixity = np.concatenate((self.fixity, np.zeros_like(self.fixity)))
+
+        self.capacity = 2 * n
+
+    def _grow_slots(self):
+        r"""
+        double the number of available columns (internal use)
+        """
+        for name in self.STATE:
+            A = getattr(self, name)
+            setattr(self, name, np.hstack((A, np.zeros_like(A))))
+        self.fixity = np.hstack((self.fixity, np.zeros_like(self.fixity)))
+
+
+def initial_positions(nodes):
+    r"""
+    Initial positions :math:`{\bf X}` for a list of nodes.
+
+    This is the vectorized equivalent of calling :py:meth:`Node.getPos` for every node.
+
+    :param nodes: list of :py:class:`Node` objects
+    :returns: array of initial positions, one row per node (``np.ndarray``)
+    """
+    if not len(nodes):
+        return np.zeros((0, 3))
+
+    pool = nodes[0]._pool
+    rows = [ node._row for node in nodes ]
+    ndim = pool.spatial_dim[rows].max()
+    return pool.positions[rows, :ndim]
+
+
+def deformed_positions(nodes, factor=1.0, modeshape=False):
+    r"""
+    Deformed positions :math:`{\bf x} = {\bf X} + f \: {\bf u}` for a list of nodes.
+
+    This is the vectorized equivalent of calling :py:meth:`Node.getDeformedPos` for every node.
+
+    :param nodes: list of :py:class:`Node` objects
+    :param factor: deformation magnification factor, :math:`f`.
+    :param modeshape: set to **True** to use the stored mode shape instead of the current displacements.
+    :returns: array of deformed positions, one row per node (``np.ndarray``)
+    """
+    if not len(nodes):
+        return np.zeros((0, 3))
+
+    rows = [ node._row for node in nodes ]
+    return nodes[0]._pool.deformed_positions(factor=factor, modeshape=modeshape, rows=rows)
@@ -511,7 +511,7 @@ class System():
                 # spread the news about the new load level throughout the system
                 self.setLoadFactor(self.solver.loadfactor)
         else:
-            msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+            msg = f"** WARNING ** {type(self).__name__}.solve not implemented"
             raise NotImplementedError(msg)
 
     def checkStability(self, **kwdargs):
@@ -300,7 +300,7 @@ class Transformation():
         maps = self._caller_check(caller)
 
         for map in maps:
-            map = np.array(map, dtype=int)
+            map = np.array(map, dtype=np.int32)
             local_vec  = Mtransformed[map,:]
             global_vec = self.T.T @ local_vec
             Mtransformed[map,:] = global_vec
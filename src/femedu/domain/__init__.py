@@ -1,5 +1,10 @@
 __all__ = (
     'Node',
+    'Node1D',
+    'Node2D',
+    'Node3D',
+    'NodePool',
+    'DofMap',
     'System',
     'Transformation',
     'CosseratTransformation',
@@ -12,7 +17,9 @@ __all__ = (
 )
 
 from .System                import System
-from .Node                  import Node
+from .Node                  import Node, Node1D, Node2D, Node3D
+from .NodePool              import NodePool
+from .DofMap                import DofMap
 from .Transformation        import Transformation
 from .FrameTransformation   import FrameTransformation
 from .Frame2dTransformation import Frame2dTransformation
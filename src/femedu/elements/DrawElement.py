@@ -61,6 +61,8 @@ class DrawElement():
     QUAD        = 0x000010  # plates, shells
     BRICK       = 0x000020  # continuum
 
+    __slots__ = ('element_type',)
+
     def __init__(self):
         self.element_type = self.UNKNOWN
 
@@ -94,15 +96,36 @@ class DrawElement():
             raise NotImplementedError
 
 
+    def _drawPolyline(self, order, factor, **kwargs):
+        r"""
+        deformed positions of the nodes listed in **order**, collected in a single array operation
+
+        :param order: sequence of local node indices defining the polyline
+        :param factor: deformation magnification factor
+        :returns: tuple of x-, y-, and z-coordinates (same layout as :py:meth:`PlotCurve.asTuple`)
+        """
+        from ..domain.NodePool import deformed_positions
+
+        nodes = [ self.nodes[i] for i in order ]
+        X = deformed_positions(nodes, factor=factor, modeshape=kwargs.get('modeshape', False))
+
+        if X.shape[1] < 2:
+            return PlotCurve().asTuple()
+
+        if X.shape[1] > 2:
+            z = X[:,2]
+        else:
+            z = np.array([])
+
+        return (X[:,0], X[:,1], z)
+
     def drawLine(self, factor, **kwargs):
         r"""
         implementation of a generic :code:`LINE` type
         """
-        c = PlotCurve()
         if len(self.nodes) >= 2:
-            for node in self.nodes[:2]:
-                c += node.getDeformedPos(self, factor, **kwargs)
-        return c.asTuple()
+            return self._drawPolyline((0,1), factor, **kwargs)
+        return PlotCurve().asTuple()
 
     def drawCurve(self, factor, **kwargs):
         r"""
@@ -178,85 +201,48 @@ class DrawElement():
         r"""
         implementation of a generic :code:`TRIANGLE` type
         """
-        c = PlotCurve()
         if len(self.nodes) >= 6:
 
             # 6-noded triangle
-
-            c+= self.nodes[0].getDeformedPos(self, factor, **kwargs)
-            c+= self.nodes[3].getDeformedPos(self, factor, **kwargs)
-            c+= self.nodes[1].getDeformedPos(self, factor, **kwargs)
-            c+= self.nodes[4].getDeformedPos(self, factor, **kwargs)
-            c+= self.nodes[2].getDeformedPos(self, factor, **kwargs)
-            c+= self.nodes[5].getDeformedPos(self, factor, **kwargs)
-            c+= self.nodes[0].getDeformedPos(self, factor, **kwargs)
+            return self._drawPolyline((0,3,1,4,2,5,0), factor, **kwargs)
 
         elif len(self.nodes) >= 3:
 
             # 3-noded triangle
+            return self._drawPolyline((0,1,2,0), factor, **kwargs)
 
-            for node in self.nodes[:3]:
-                c += node.getDeformedPos(self, factor, **kwargs)
-            c+= self.nodes[0].getDeformedPos(self, factor, **kwargs)
-
-        return c.asTuple()
+        return PlotCurve().asTuple()
 
     def drawTetrahedron(self, factor, **kwargs):
         r"""
         implementation of a generic :code:`TETRAHEDRON` type
         """
-        c = PlotCurve()
         if len(self.nodes) >= 4:
-            for node in self.nodes:
-                c += node.getDeformedPos(self, factor, **kwargs)
-            c+= self.nodes[0].getDeformedPos(self, factor, **kwargs)
-        return c.asTuple()
+            return self._drawPolyline(tuple(range(len(self.nodes))) + (0,), factor, **kwargs)
+        return PlotCurve().asTuple()
 
     def drawQuad(self, factor, **kwargs):
         r"""
         implementation of a generic :code:`QUAD` type
         """
-        c = PlotCurve()
         match len(self.nodes):
             case 4:
-                for node in self.nodes[:4]:
-                    c += node.getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[0].getDeformedPos(self, factor, **kwargs)
+                return self._drawPolyline((0,1,2,3,0), factor, **kwargs)
             case 8:
-                c += self.nodes[0].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[4].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[1].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[5].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[2].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[6].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[3].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[7].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[0].getDeformedPos(self, factor, **kwargs)
+                return self._drawPolyline((0,4,1,5,2,6,3,7,0), factor, **kwargs)
             case 9:
-                c += self.nodes[0].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[4].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[1].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[5].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[2].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[6].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[3].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[7].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[0].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[8].getDeformedPos(self, factor, **kwargs)
-                c += self.nodes[0].getDeformedPos(self, factor, **kwargs)
-
-        return c.asTuple()
+                return self._drawPolyline((0,4,1,5,2,6,3,7,0,8,0), factor, **kwargs)
+
+        return PlotCurve().asTuple()
 
     def drawBrick(self, factor, **kwargs):
         r"""
         implementation of a generic :code:`BRICK` type
         """
-        c = PlotCurve()
         if len(self.nodes) >= 8:
-            for node in self.nodes[:4]:
-                c += node.getDeformedPos(self, factor, **kwargs)
-            c+= self.nodes[0].getDeformedPos(self, factor, **kwargs)
-        return c.asTuple()
+            return self._drawPolyline((0,1,2,3,0), factor, **kwargs)
+        return PlotCurve().asTuple()
+
 
 
 
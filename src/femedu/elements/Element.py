@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 import numpy as np
 import os
 import sys
@@ -9,6 +7,95 @@ from .DrawElement import *
 from ..recorder.Recorder import Recorder
 from .Face2D import *
 from .Face3D import *
+from .ElementBatch import ElementBatch
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+# face topology: (element_type, number of nodes) -> (face class, node indices for each face)
+_FACE_TABLE = {
+    (DrawElement.TRIANGLE, 3):    (Face2D, ((0, 1), (1, 2), (2, 0))),
+    (DrawElement.TRIANGLE, 6):    (Face2D, ((0, 3, 1), (1, 4, 2), (2, 5, 0))),
+    (DrawElement.TETRAHEDRON, 4): (Face3D, ((0, 2, 1), (0, 1, 3), (1, 2, 3), (2, 0, 3))),
+    (DrawElement.TETRAHEDRON, 10):(Face3D, ((0, 2, 1, 6, 5, 4),
+                                            (0, 1, 3, 4, 8, 7),
+                                            (1, 2, 3, 5, 9, 8),
+                                            (2, 0, 3, 6, 7, 9))),
+    (DrawElement.QUAD, 4):        (Face2D, ((0, 1), (1, 2), (2, 3), (3, 0))),
+    (DrawElement.QUAD, 8):        (Face2D, ((0, 4, 1), (1, 5, 2), (2, 6, 3), (3, 7, 0))),
+    (DrawElement.QUAD, 9):        (Face2D, ((0, 4, 1), (1, 5, 2), (2, 6, 3), (3, 7, 0))),
+    (DrawElement.BRICK, 8):       (Face3D, ((0, 3, 2, 1),
+                                            (0, 1, 5, 4),
+                                            (1, 2, 6, 5),
+                                            (2, 3, 7, 6),
+                                            (3, 0, 4, 7),
+                                            (4, 5, 6, 7))),
+    (DrawElement.BRICK, 20):      (Face3D, ((0, 3, 2, 1, 11, 10,  9,  8),
+                                            (0, 1, 5, 4,  8, 13, 16, 12),
+                                            (1, 2, 6, 5,  9, 14, 17, 13),
+                                            (2, 3, 7, 6, 10, 15, 18, 14),
+                                            (3, 0, 4, 7, 11, 12, 19, 15),
+                                            (4, 5, 6, 7, 16, 17, 18, 19))),
+    (DrawElement.BRICK, 27):      (Face3D, ((0, 3, 2, 1, 11, 10,  9,  8, 20),
+                                            (0, 1, 5, 4,  8, 13, 16, 12, 21),
+                                            (1, 2, 6, 5,  9, 14, 17, 13, 22),
+                                            (2, 3, 7, 6, 10, 15, 18, 14, 23),
+                                            (3, 0, 4, 7, 11, 12, 19, 15, 24),
+                                            (4, 5, 6, 7, 16, 17, 18, 19, 25))),
+}
+
+
+if HAS_NUMBA:
+
+    @njit(cache=True)
+    def _transform_kernel(KT, Q, has_T):
+        n    = KT.shape[0]
+        ndof = KT.shape[2]
+        tmp  = np.empty((ndof, ndof))
+
+        for i in range(n):
+            for j in range(n):
+                if not (has_T[i] or has_T[j]):
+                    continue
+                # tmp = Q[i] @ KT[i,j]
+                for a in range(ndof):
+                    for b in range(ndof):
+                        val = 0.0
+                        for c in range(ndof):
+                            val += Q[i, a, c] * KT[i, j, c, b]
+                        tmp[a, b] = val
+                # KT[i,j] = tmp @ Q[j].T
+                for a in range(ndof):
+                    for b in range(ndof):
+                        val = 0.0
+                        for c in range(ndof):
+                            val += tmp[a, c] * Q[j, b, c]
+                        KT[i, j, a, b] = val
+
+
+def apply_node_transforms(KT, Q, has_T):
+    r"""
+    Transform the nodal blocks of an element stiffness in place,
+    :math:`{\bf K}_{ij} \leftarrow {\bf Q}_i \: {\bf K}_{ij} \: {\bf Q}_j^T`,
+    for all node pairs where at least one node carries a transformation.
+
+    Uses a compiled kernel if :code:`numba` is available.
+
+    :param KT: element stiffness as array of shape (nnodes,nnodes,ndofs,ndofs)
+    :param Q: nodal transformation matrices as array of shape (nnodes,ndofs,ndofs)
+    :param has_T: boolean array, **True** for nodes carrying a transformation
+    """
+    if HAS_NUMBA:
+        _transform_kernel(KT, Q, has_T)
+        return
+
+    for i in range(KT.shape[0]):
+        for j in range(KT.shape[1]):
+            if has_T[i] or has_T[j]:
+                KT[i, j] = Q[i] @ KT[i, j] @ Q[j].T
 
 
 class Element(DrawElement):
@@ -18,6 +105,12 @@ class Element(DrawElement):
 
     COUNT = 0
 
+    __slots__ = ('ID', 'label', 'nodes', 'transforms', 'material', 'dof_idx', '_dof_list',
+                 'force', 'Loads', 'Forces', 'Kt', '_Forces', '_Kt', '_face_spec', '_faces',
+                 'distributed_load', 'recorder', 'loadfactor', 'n_nodes', 'n_dofs',
+                 '_has_T', '_has_any_transform', '_transform_rev', '_force_out',
+                 '_state_token', '_rows')
+
     def __init__(self, nodes, material, label=None):
         r"""
         :param nodes: list of node pointers
@@ -31,21 +124,49 @@ class Element(DrawElement):
         self.label = label
         
         self.nodes    = nodes
+        self.n_nodes  = len(nodes)   # number of nodes
+        self._rows    = np.array([ node._row for node in nodes ], dtype=np.intp)   # pool rows of the nodes
+        self.n_dofs   = 0            # number of dofs per node (see _requestDofs)
         self.transforms = [ None for nd in self.nodes ]
         self.material = material
-        self.dof_idx  = {}   # marked for removal
+        self.dof_idx  = None   # local d.o.f. indices, one row per node (see _requestDofs)
 
         self._requestDofs( tuple() )
 
-        self.force    = 0.0
-        self.Loads    = [ [] for i in range(len(nodes)) ]
-        self.Forces   = []
-        self.Kt       = []
+        self.Loads    = [ None for i in range(self.n_nodes) ]   # nodal element loads: np.ndarray or None
+        # Forces and Kt are set by initialize() or by the element's own constructor/updateState()
+        self._Forces  = None   # contiguous storage for Forces (see reset_matrices)
+        self._Kt      = None   # contiguous storage for Kt (see reset_matrices)
+        self._force_out = None   # reused output buffer of getForce
+        self._face_spec = None   # (face class, connectivity) from _FACE_TABLE (see createFaces)
+        self._faces     = None   # face objects, created on first access (see faces)
+
+        self._has_T             = None    # nodes carrying a transformation (see _hasAnyTransform)
+        self._has_any_transform = False
+        self._transform_rev     = None    # pool revision for which _has_T is valid
+        self._state_token       = None    # nodal state for which Forces and Kt are valid (see _ensureState)
 
         self.setRecorder(None)
 
         self.setLoadFactor(1.0)
 
+    @classmethod
+    def assemble_batch(cls, elements):
+        r"""
+        Update a list of elements in batches.
+
+        Elements are grouped by class and d.o.f. list into :py:class:`ElementBatch` objects.
+        Each batch is evaluated in a single pass if the element class provides :code:`_batchState()`.
+
+        :param elements: list of elements
+        :returns: list of updated :py:class:`ElementBatch` objects
+        """
+        batches = ElementBatch.group(elements)
+        for batch in batches:
+            batch.update()
+
+        return batches
+
     def __str__(self):
         if self.label:
             s = "{} ({}_{}): nodes ( ".format(self.label, self.__class__.__name__, self.ID)
@@ -59,12 +180,12 @@ class Element(DrawElement):
 
     def __repr__(self):
         if self.label:
-            fmt = "{}[{}](" + len(self.nodes)*"{}, " + "{})"
+            fmt = "{}[{}](" + self.n_nodes*"{}, " + "{})"
             ans = fmt.format(self.__class__.__name__, self.label,
                                     *[ node.getID() for node in self.nodes ],
                                     repr(self.material))
         else:
-            fmt = "{}(" + len(self.nodes)*"{}, " + "{})"
+            fmt = "{}(" + self.n_nodes*"{}, " + "{})"
             ans = fmt.format(self.__class__.__name__,
                                     *[ node.getID() for node in self.nodes ],
                                     repr(self.material))
@@ -84,7 +205,7 @@ class Element(DrawElement):
 
         self.createFaces()
 
-        nnodes = len(self.nodes)
+        nnodes = self.n_nodes
         self.distributed_load = [ 0.0 for i in range(nnodes) ]
 
         self.reset_matrices()
@@ -92,12 +213,23 @@ class Element(DrawElement):
     def reset_matrices(self):
         r"""
         (re-)initializes element stiffness matrix and element force
+
+        Both are allocated as single contiguous arrays, :code:`self._Forces` of shape (nnodes,ndofs)
+        and :code:`self._Kt` of shape (nnodes,nnodes,ndofs,ndofs).  :code:`self.Forces[i]` and
+        :code:`self.Kt[i][j]` are views into these arrays, so in-place updates of the nodal
+        blocks are reflected in the contiguous arrays and vice versa.
         """
-        nnodes = len(self.nodes)
-        ndofs  = len(self._dof_list)
+        nnodes = self.n_nodes
+        ndofs  = self.n_dofs
 
-        self.Forces   = [ np.zeros(ndofs) for k in range(len(self.nodes)) ]
-        self.Kt       = [ [ np.zeros((ndofs,ndofs)) for k in range(nnodes) ] for m in range(nnodes) ]
+        # allocate, then touch all pages in a single sweep
+        self._Forces  = np.empty((nnodes, ndofs), dtype=np.float64, order='C')
+        self._Kt      = np.empty((nnodes, nnodes, ndofs, ndofs), dtype=np.float64, order='C')
+        self._Forces.fill(0.0)
+        self._Kt.fill(0.0)
+
+        self.Forces   = list(self._Forces)
+        self.Kt       = [ list(Krow) for Krow in self._Kt ]
 
         return (nnodes, ndofs)
 
@@ -105,113 +237,36 @@ class Element(DrawElement):
         r"""
         default implementation for resetting element loads.
         """
-        for face in self.faces:
+        for face in self._faces or ():
             face.setLoad(0.0, 0.0)
 
     def createFaces(self):
+        r"""
+        Register the faces of this element as listed in :code:`_FACE_TABLE` for its element type and number of nodes.
 
-        self.faces = []
-
-        if self.element_type == self.LINE:
-            msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        The face objects are created on first access of :py:attr:`faces`.
+        """
+        try:
+            self._face_spec = _FACE_TABLE[(self.element_type, self.n_nodes)]
+        except KeyError:
+            msg = f"** WARNING ** {type(self).__name__}.createFaces not implemented"
             raise NotImplementedError(msg)
 
-        elif self.element_type == self.CURVE :
-            msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
-            raise NotImplementedError(msg)
+        self._faces = None
 
-        elif self.element_type == self.TRIANGLE :
-            nNds = len(self.nodes)
-            if nNds == 3:
-                self.faces.append(Face2D(f"{self.ID}.0", self.nodes[0],self.nodes[1]))
-                self.faces.append(Face2D(f"{self.ID}.1", self.nodes[1],self.nodes[2]))
-                self.faces.append(Face2D(f"{self.ID}.2", self.nodes[2],self.nodes[0]))
-            elif nNds == 6:
-                self.faces.append(Face2D(f"{self.ID}.0", self.nodes[0],self.nodes[3],self.nodes[1]))
-                self.faces.append(Face2D(f"{self.ID}.1", self.nodes[1],self.nodes[4],self.nodes[2]))
-                self.faces.append(Face2D(f"{self.ID}.2", self.nodes[2],self.nodes[5],self.nodes[0]))
-            else:
-                msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
-                raise NotImplementedError(msg)
-
-        elif self.element_type == self.TETRAHEDRON :
-            nNds = len(self.nodes)
-            if nNds == 4:
-                self.faces.append(Face3D(f"{self.ID}.0", self.nodes[0],self.nodes[2],self.nodes[1]))
-                self.faces.append(Face3D(f"{self.ID}.1", self.nodes[0],self.nodes[1],self.nodes[3]))
-                self.faces.append(Face3D(f"{self.ID}.2", self.nodes[1],self.nodes[2],self.nodes[3]))
-                self.faces.append(Face3D(f"{self.ID}.3", self.nodes[2],self.nodes[0],self.nodes[3]))
-            elif nNds == 10 :
-                self.faces.append(Face3D(f"{self.ID}.0", self.nodes[0],self.nodes[2],self.nodes[1],
-                                                         self.nodes[6],self.nodes[5],self.nodes[4]))
-                self.faces.append(Face3D(f"{self.ID}.1", self.nodes[0],self.nodes[1],self.nodes[3],
-                                                         self.nodes[4],self.nodes[8],self.nodes[7]))
-                self.faces.append(Face3D(f"{self.ID}.2", self.nodes[1],self.nodes[2],self.nodes[3],
-                                                         self.nodes[5],self.nodes[9],self.nodes[8]))
-                self.faces.append(Face3D(f"{self.ID}.3", self.nodes[2],self.nodes[0],self.nodes[3],
-                                                         self.nodes[6],self.nodes[7],self.nodes[9]))
-            else:
-                msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
-                raise NotImplementedError(msg)
-
-        elif self.element_type == self.QUAD :
-            nNds = len(self.nodes)
-            if nNds == 4:
-                self.faces.append(Face2D(f"{self.ID}.0", self.nodes[0],self.nodes[1]))
-                self.faces.append(Face2D(f"{self.ID}.1", self.nodes[1],self.nodes[2]))
-                self.faces.append(Face2D(f"{self.ID}.2", self.nodes[2],self.nodes[3]))
-                self.faces.append(Face2D(f"{self.ID}.3", self.nodes[3],self.nodes[0]))
-            elif nNds == 8 or nNds == 9 :
-                self.faces.append(Face2D(f"{self.ID}.0", self.nodes[0],self.nodes[4],self.nodes[1]))
-                self.faces.append(Face2D(f"{self.ID}.1", self.nodes[1],self.nodes[5],self.nodes[2]))
-                self.faces.append(Face2D(f"{self.ID}.2", self.nodes[2],self.nodes[6],self.nodes[3]))
-                self.faces.append(Face2D(f"{self.ID}.3", self.nodes[3],self.nodes[7],self.nodes[0]))
-            else:
-                msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
-                raise NotImplementedError(msg)
-
-        elif self.element_type == self.BRICK :
-            nNds = len(self.nodes)
-            if nNds == 8:
-                self.faces.append(Face3D(f"{self.ID}.0", self.nodes[0],self.nodes[3],self.nodes[2],self.nodes[1]))
-                self.faces.append(Face3D(f"{self.ID}.1", self.nodes[0],self.nodes[1],self.nodes[5],self.nodes[4]))
-                self.faces.append(Face3D(f"{self.ID}.2", self.nodes[1],self.nodes[2],self.nodes[6],self.nodes[5]))
-                self.faces.append(Face3D(f"{self.ID}.3", self.nodes[2],self.nodes[3],self.nodes[7],self.nodes[6]))
-                self.faces.append(Face3D(f"{self.ID}.4", self.nodes[3],self.nodes[0],self.nodes[4],self.nodes[7]))
-                self.faces.append(Face3D(f"{self.ID}.5", self.nodes[4],self.nodes[5],self.nodes[6],self.nodes[7]))
-            elif nNds == 20 :
-                self.faces.append(Face3D(f"{self.ID}.0", self.nodes[0],self.nodes[3],self.nodes[2],self.nodes[1],
-                                                         self.nodes[11],self.nodes[10],self.nodes[9],self.nodes[8]))
-                self.faces.append(Face3D(f"{self.ID}.1", self.nodes[0],self.nodes[1],self.nodes[5],self.nodes[4],
-                                                         self.nodes[8],self.nodes[13],self.nodes[16],self.nodes[12]))
-                self.faces.append(Face3D(f"{self.ID}.2", self.nodes[1],self.nodes[2],self.nodes[6],self.nodes[5],
-                                                         self.nodes[9],self.nodes[14],self.nodes[17],self.nodes[13]))
-                self.faces.append(Face3D(f"{self.ID}.3", self.nodes[2],self.nodes[3],self.nodes[7],self.nodes[6],
-                                                         self.nodes[10],self.nodes[15],self.nodes[18],self.nodes[14]))
-                self.faces.append(Face3D(f"{self.ID}.4", self.nodes[3],self.nodes[0],self.nodes[4],self.nodes[7],
-                                                         self.nodes[11],self.nodes[12],self.nodes[19],self.nodes[15]))
-                self.faces.append(Face3D(f"{self.ID}.5", self.nodes[4],self.nodes[5],self.nodes[6],self.nodes[7],
-                                                         self.nodes[16],self.nodes[17],self.nodes[18],self.nodes[19]))
-            elif nNds == 27 :
-                self.faces.append(Face3D(f"{self.ID}.0", self.nodes[0],self.nodes[3],self.nodes[2],self.nodes[1],
-                                            self.nodes[11],self.nodes[10],self.nodes[9],self.nodes[8],self.nodes[20]))
-                self.faces.append(Face3D(f"{self.ID}.1", self.nodes[0],self.nodes[1],self.nodes[5],self.nodes[4],
-                                            self.nodes[8],self.nodes[13],self.nodes[16],self.nodes[12],self.nodes[21]))
-                self.faces.append(Face3D(f"{self.ID}.2", self.nodes[1],self.nodes[2],self.nodes[6],self.nodes[5],
-                                            self.nodes[9],self.nodes[14],self.nodes[17],self.nodes[13],self.nodes[22]))
-                self.faces.append(Face3D(f"{self.ID}.3", self.nodes[2],self.nodes[3],self.nodes[7],self.nodes[6],
-                                            self.nodes[10],self.nodes[15],self.nodes[18],self.nodes[14],self.nodes[23]))
-                self.faces.append(Face3D(f"{self.ID}.4", self.nodes[3],self.nodes[0],self.nodes[4],self.nodes[7],
-                                            self.nodes[11],self.nodes[12],self.nodes[19],self.nodes[15],self.nodes[24]))
-                self.faces.append(Face3D(f"{self.ID}.5", self.nodes[4],self.nodes[5],self.nodes[6],self.nodes[7],
-                                            self.nodes[16],self.nodes[17],self.nodes[18],self.nodes[19],self.nodes[25]))
-            else:
-                msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
-                raise NotImplementedError(msg)
-
-        else:
-            msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
-            raise NotImplementedError(msg)
+    @property
+    def faces(self):
+        r"""
+        List of faces of this element.  Faces are created on first access, so elements that never
+        receive a surface load or flux do not carry face objects.
+        """
+        if self._faces is None:
+            if self._face_spec is None:
+                return []
+            FaceCls, connectivity = self._face_spec
+            self._faces = [ FaceCls(f"{self.ID}.{k}", *[ self.nodes[i] for i in idx ])
+                            for k, idx in enumerate(connectivity) ]
+        return self._faces
 
     def setSurfaceLoad(self, face_idx, pn, ps=0):
         r"""
@@ -224,7 +279,7 @@ class Element(DrawElement):
         :param pn: magnitude of distributed normal load per unit length. Tension on a surface is positive.
         :param ps: magnitude of distributed shear load per unit length. Positive shear rotates the element counter-clockwise.
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.setSurfaceLoad not implemented"
         raise NotImplementedError(msg)
 
     def addTransformation(self, T, local_nodes=[]):
@@ -248,6 +303,8 @@ class Element(DrawElement):
             T.registerClient(self)            # register this Element with the transformation
             self.transforms = [ T for nd in self.nodes ]
 
+        self._transform_rev = None   # re-check node transformations on next use
+
     def getPos(self, node, **kwargs):
         r"""
         Use this function to get nodal displacements from inside your element implementation.
@@ -276,12 +333,20 @@ class Element(DrawElement):
 
         :return:
         """
-        self.updateState()
+        self._ensureState()
 
         # make sure forces are returned in each respective node's local coordinates
+        # (rows of a reused buffer wherever shapes permit)
+        out = self._force_out
+        if out is None or out.shape != (self.n_nodes, self.n_dofs):
+            out = self._force_out = np.zeros((self.n_nodes, self.n_dofs))
+
         forces = []
-        for node, force in zip(self.nodes, self.Forces):
-            forces.append(node.v2l(force, self))
+        for node, force, row in zip(self.nodes, self.Forces, out):
+            if np.shape(force) == row.shape:
+                forces.append(node.v2l(force, self, out=row))
+            else:
+                forces.append(node.v2l(force, self))
 
         return forces
 
@@ -302,18 +367,9 @@ class Element(DrawElement):
         # .. applied element load (reference load)
         self.computeSurfaceLoads()
 
-        if isinstance(self.Loads, (list,tuple,np.ndarray)):
-            Loads = []
-            for node, load in zip(self.nodes, self.Loads):
-                if isinstance(load, np.ndarray):
-                    Loads.append(node.v2l(load, self))
-                else:
-                    Loads.append(None)
-            return Loads
-        elif self.Loads:
-            return self.Loads
-        else:
-            return [ None for k in self.nodes ]
+        # self.Loads holds one np.ndarray (or None) per node
+        return [ node.v2l(load, self) if load is not None else None
+                 for node, load in zip(self.nodes, self.Loads) ]
 
     def computeSurfaceLoads(self):
         self.Loads = [ None for nd0 in self.nodes ]
@@ -328,13 +384,13 @@ class Element(DrawElement):
         return "Elem_{}".format(self.ID)
 
     def getInternalForce(self, variable=''):
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.getInternalForce not implemented"
         #raise NotImplementedError(msg)
-        warnings.warn(msg)
+        warnings.warn(msg, stacklevel=2)
         return (None, None)
 
     def getStress(self):
-        self.updateState()
+        self._ensureState()
         return None
 
     def mapGaussPoints(self, var):
@@ -345,46 +401,155 @@ class Element(DrawElement):
 
         :param var: variable code for a variable to be mapped from Gauss-points to nodes
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.mapGaussPoints not implemented"
         #raise NotImplementedError(msg)
-        warnings.warn(msg)
+        warnings.warn(msg, stacklevel=2)
+
+    def _KtIsView(self):
+        r"""
+        :returns: **True** if every nodal block of :code:`self.Kt` is a view into :code:`self._Kt` (internal use)
+        """
+        if self._Kt is None or len(self.Kt) != self._Kt.shape[0]:
+            return False
+
+        for Krow in self.Kt:
+            if len(Krow) != self._Kt.shape[1]:
+                return False
+            for Kij in Krow:
+                if not isinstance(Kij, np.ndarray) or Kij.base is not self._Kt:
+                    return False
+
+        return True
 
     def getStiffness(self):
         r"""
         :return: the current tangent stiffness matrix
         """
-        self.updateState()
-
-        KT = deepcopy(self.Kt)
-
-        for i, ndI in enumerate(self.nodes):
-            for j, ndJ in enumerate(self.nodes):
-                #
-                # this can be an expensive operation.
-                # check if really needed and avoid identity operations:
-                #
-                if (ndI.hasTransform() or ndJ.hasTransform()):
-                    KTij = KT[i][j]
-
-                    # transform KTij
-                    # ... as a sequence of vector-like transformations
-                    KTij = KTij.T
-                    if ndJ.hasTransform():
-                        KTij = ndJ.m2l(KTij, self)
-
-                    KTij = KTij.T
-                    if ndI.hasTransform():
-                        KTij = ndI.m2l(KTij, self)
-
-                    KT[i][j] = KTij
+        self._ensureState()
+
+        if isinstance(self.Kt, np.ndarray):
+            KT = self.Kt.copy()
+        elif self._KtIsView():
+            # nodal blocks are views into the contiguous tensor: copy it at once
+            KT = self._Kt.copy()
+        else:
+            try:
+                KT = np.array(self.Kt, dtype=float)
+            except (ValueError, TypeError):
+                # nodal blocks of different size
+                KT = [ [ Kij.copy() if isinstance(Kij, np.ndarray) else Kij for Kij in Krow ] for Krow in self.Kt ]
+
+        if self._hasAnyTransform():
+            has_T = self._has_T
+            Q = self._nodeTransforms(KT, has_T)
+            if Q is not None:
+                # all transformations act on the full nodal blocks: transform in one pass
+                apply_node_transforms(KT, Q, has_T)
+            else:
+                KT = [ list(KTrow) for KTrow in KT ]
+
+                for i, ndI in enumerate(self.nodes):
+                    for j, ndJ in enumerate(self.nodes):
+                        #
+                        # this can be an expensive operation.
+                        # check if really needed and avoid identity operations:
+                        #
+                        if (has_T[i] or has_T[j]):
+                            KTij = KT[i][j]
+
+                            # transform KTij
+                            # ... as a sequence of vector-like transformations
+                            KTij = KTij.T
+                            if has_T[j]:
+                                KTij = ndJ.m2l(KTij, self)
+
+                            KTij = KTij.T
+                            if has_T[i]:
+                                KTij = ndI.m2l(KTij, self)
+
+                            KT[i][j] = KTij
+
+        if isinstance(KT, np.ndarray):
+            KT = [ list(KTrow) for KTrow in KT ]
+
         return KT
 
+    def _hasAnyTransform(self):
+        r"""
+        Helper function (internal use) checking whether any node of this element carries a transformation.
+
+        The result is cached and refreshed whenever the node pool reports a layout change of one of
+        this element's nodes, e.g., after :py:meth:`Node.addTransformation`.
+
+        :returns: **True** if at least one node has a transformation
+        """
+        token    = self._poolToken()
+        revision = token[0] if token is not None else None
+        if self._transform_rev is None or self._transform_rev != revision:
+            self._has_T = np.array([ node.hasTransform() for node in self.nodes ], dtype=bool)
+            self._has_any_transform = bool(self._has_T.any())
+            self._transform_rev = revision
+        return self._has_any_transform
+
+    def _nodeTransforms(self, KT, has_T):
+        r"""
+        Helper function (internal use) collecting the nodal transformation matrices for :py:meth:`getStiffness`.
+
+        :param KT: element stiffness
+        :param has_T: boolean array, **True** for nodes carrying a transformation
+        :returns: stacked nodal transformation matrices (identity for nodes without transformation), or
+                  **None** if the element stiffness is not a (nnodes,nnodes,ndofs,ndofs) array
+                  or the element does not use all d.o.f.s of a transformed node in nodal order.
+        """
+        if not isinstance(KT, np.ndarray) or KT.ndim != 4:
+            return None
+
+        ndofs = KT.shape[2]
+        Q = np.empty((self.n_nodes, ndofs, ndofs))
+
+        for k, node in enumerate(self.nodes):
+            if has_T[k]:
+                if not np.array_equal(node.getIdx4DOFs(self.getDofs(), local=True), np.arange(ndofs)):
+                    return None
+                Qk = node.getTransformMatrix()
+                if Qk.shape != (ndofs, ndofs):
+                    return None
+                Q[k] = Qk
+            else:
+                Q[k] = np.identity(ndofs)
+
+        return Q
+
     def updateState(self):
         """
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.updateState not implemented"
         raise NotImplementedError(msg)
 
+    def _ensureState(self):
+        r"""
+        Helper function (internal use) calling :py:meth:`updateState` only if the nodal state has changed
+        since the last call, such that :py:meth:`getForce` and :py:meth:`getStiffness` share a single update
+        per iteration.
+
+        The element state is also refreshed after :py:meth:`setLoadFactor`, :py:meth:`on_converged`,
+        and :py:meth:`revert`.
+        """
+        token = self._poolToken()
+        if token is None or token != self._state_token:
+            self.updateState()
+            self._state_token = token
+
+    def _poolToken(self):
+        r"""
+        Helper function (internal use)
+
+        :returns: the :py:meth:`NodePool.token` of this element's nodes, or **None** for an element without nodes
+        """
+        if not self.n_nodes:
+            return None
+        return self.nodes[0]._pool.token(self._rows)
+
     def _requestDofs(self, dof_requests):
         r"""
         Helper function (internal use) to inform **all** nodes of this element about the needed/used
@@ -393,12 +558,16 @@ class Element(DrawElement):
         **Remark**: if nodes of different type are to be used by the element, **DO NOT** use this method but
         implement your own overloaded initialization within the constructor of your element.
 
+        The local d.o.f. indices returned by the nodes are stored in :code:`self.dof_idx`,
+        an array of shape (nnodes,ndofs) with row :code:`k` holding the indices at :code:`self.nodes[k]`.
+
         :param dof_requests: list of dofs for a typical node in this element
         """
         self._dof_list = dof_requests
-        for node in self.nodes:
-            dof_idx = node.request(dof_requests, self)
-            self.dof_idx[node] = dof_idx   # marked for removal
+        self.n_dofs    = len(dof_requests)
+        self.dof_idx   = np.empty((self.n_nodes, self.n_dofs), dtype=np.int32)
+        for k, node in enumerate(self.nodes):
+            self.dof_idx[k, :] = node.request(dof_requests, self)
 
     def getDofs(self):
         r"""
@@ -422,6 +591,7 @@ class Element(DrawElement):
         entire entered load is applied in full.
         """
         self.loadfactor = lam
+        self._state_token = None
 
     def setRecorder(self, recorder):
         if isinstance(recorder, Recorder):
@@ -462,7 +632,7 @@ class Element(DrawElement):
         The element shall perform all necessary state updates,
         especially inform it's material instances about the necessary updates.
         """
-        pass
+        self._state_token = None
 
     def revert(self):
         r"""
@@ -472,7 +642,7 @@ class Element(DrawElement):
         The element shall perform all necessary state updates,
         especially inform it's material instances about the necessary updates.
         """
-        pass
+        self._state_token = None
 
 
 if __name__ == "__main__":
@@ -484,9 +654,7 @@ if __name__ == "__main__":
 
     # testing the Element class
     nd0 = Node(0.0, 0.0)
-    nd0.index = 0
     nd1 = Node(3.0, 2.0)
-    nd1.index = 1
     params = {'E':100, 'A':1.5, 'fy':1.0e20}
     mat = Material(params)
     elem = Element([nd0, nd1], mat)
@@ -0,0 +1,152 @@
+import numpy as np
+
+
+class ElementBatch():
+    r"""
+    class: a group of elements of the same type evaluated in a single pass
+
+    Element classes may provide a classmethod :code:`_batchState(batch)` that computes internal forces and
+    tangent stiffness for all elements of a batch using array operations on stacked data.
+    Elements without such a method are updated one at a time.
+
+    .. list-table:: batch arrays
+        :header-rows: 1
+
+        * - name
+          - shape
+          - description
+        * - **Forces**
+          - (nelem,nnodes,ndofs)
+          - nodal internal forces of each element (global frame)
+        * - **Kt**
+          - (nelem,nnodes,nnodes,ndofs,ndofs)
+          - nodal blocks of the tangent stiffness of each element (global frame)
+
+    After :py:meth:`update`, :code:`element.Forces[i]` and :code:`element.Kt[i][j]` are views into these arrays,
+    and the elements consider their state current until the nodal state changes (see :py:meth:`Element._ensureState`).
+
+    The pool stores displacements in the global frame.  Batches containing a node with a transformation
+    are therefore updated one element at a time.
+
+    :param elements: list of elements of the same class using the same list of d.o.f.s
+    """
+
+    def __init__(self, elements):
+        self.elements      = list(elements)
+        self.element_class = type(self.elements[0])
+        self.dofs          = tuple(self.elements[0].getDofs())
+
+        for element in self.elements:
+            if type(element) is not self.element_class or tuple(element.getDofs()) != self.dofs:
+                msg = "all elements of an {} must be of the same class and use the same dofs".format(self.__class__.__name__)
+                raise TypeError(msg)
+
+        self.nelem  = len(self.elements)
+        self.nnodes = len(self.elements[0].nodes)
+        self.ndofs  = len(self.dofs)
+
+        # allocate, then touch all pages in a single sweep
+        self.Forces = np.empty((self.nelem, self.nnodes, self.ndofs), dtype=np.float64, order='C')
+        self.Kt     = np.empty((self.nelem, self.nnodes, self.nnodes, self.ndofs, self.ndofs), dtype=np.float64, order='C')
+        self.Forces.fill(0.0)
+        self.Kt.fill(0.0)
+
+        self.pool        = self.elements[0].nodes[0]._pool
+        self.revision    = None
+        self.transformed = False   # True if any node of the batch carries a transformation
+        self._mapNodes()
+
+    def __len__(self):
+        return self.nelem
+
+    def __repr__(self):
+        return "ElementBatch({}, nelem={})".format(self.element_class.__name__, self.nelem)
+
+    @classmethod
+    def group(cls, elements, supported_only=False):
+        r"""
+        Group elements by class and d.o.f. list.
+
+        :param elements: list of elements
+        :param supported_only: set to **True** to skip element classes without batch evaluation (see :py:meth:`supports`)
+        :returns: list of :py:class:`ElementBatch` objects
+        """
+        groups = {}
+        for element in elements:
+            if supported_only and not cls.supports(type(element)):
+                continue
+            key = (type(element), tuple(element.getDofs()))
+            groups.setdefault(key, []).append(element)
+
+        return [ cls(group) for group in groups.values() ]
+
+    @staticmethod
+    def supports(element_class):
+        r"""
+        :param element_class: an element class
+        :returns: **True** if **element_class** provides :code:`_batchState()` matching its :code:`updateState()`,
+                  i.e., a subclass overriding :code:`updateState()` does not inherit batch evaluation.
+        """
+        for klass in element_class.__mro__:
+            if '_batchState' in vars(klass):
+                return element_class.updateState is klass.updateState
+        return False
+
+    def _mapNodes(self):
+        r"""
+        (re-)builds the pool location of all element d.o.f.s (internal use)
+        """
+        pool = self.pool
+        rows = np.array([ [ node._row for node in element.nodes ] for element in self.elements ], dtype=np.intp)
+
+        self.node_rows = rows.ravel()
+        self.rows      = pool.lead[rows][:, :, np.newaxis]   # (nelem,nnodes,1)
+        self.cols, _   = pool.selector(self.dofs)             # (ndofs,)
+        self.revision  = pool.token(self.node_rows)[0]
+
+        self.transformed = False
+        for element in self.elements:
+            for node in element.nodes:
+                lead = node
+                while not lead.is_lead:
+                    lead = lead.lead
+                if node.hasTransform() or lead.hasTransform():
+                    self.transformed = True
+
+    def getPos(self):
+        r"""
+        :returns: initial nodal positions as array of shape (nelem,nnodes,ndim)
+        """
+        rows = [ [ node._row for node in element.nodes ] for element in self.elements ]
+        ndim = self.pool.spatial_dim[rows].max()
+        return self.pool.positions[rows, :ndim]
+
+    def getDisp(self):
+        r"""
+        :returns: nodal displacements of all elements as array of shape (nelem,nnodes,ndofs) (global frame)
+        """
+        if self.revision != self.pool.token(self.node_rows)[0]:
+            self._mapNodes()
+        return self.pool.disps[self.rows, self.cols]
+
+    def update(self):
+        r"""
+        Compute internal forces and tangent stiffness of all elements in this batch
+        and hand the results back to the elements.
+        """
+        if self.revision != self.pool.token(self.node_rows)[0]:
+            self._mapNodes()
+
+        if self.supports(self.element_class) and not self.transformed:
+            self.element_class._batchState(self)
+        else:
+            for k, element in enumerate(self.elements):
+                element.updateState()
+                self.Forces[k] = np.reshape(element.Forces, self.Forces[k].shape)
+                self.Kt[k]     = np.reshape(element.Kt, self.Kt[k].shape)
+
+        tokens = self.pool.tokens(self.node_rows.reshape(self.nelem, -1))
+        for element, Fe, Ke, token in zip(self.elements, self.Forces, self.Kt, tokens):
+            element.Forces = list(Fe)
+            element.Kt     = [ list(Krow) for Krow in Ke ]
+            element._state_token = token
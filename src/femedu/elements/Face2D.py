@@ -176,6 +176,6 @@ class Face2D(Faces):
 
 
 
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.isFace not implemented"
         raise NotImplementedError(msg)
 
@@ -43,7 +43,7 @@ class Face3D(Faces):
         :type N: np.array
         :return: **True** if **X** and **N** match this face. **False** otherwise.
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.isFace not implemented"
         raise NotImplementedError(msg)
 
 
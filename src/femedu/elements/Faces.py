@@ -1,5 +1,4 @@
 import numpy as np
-import sys
 
 
 class Faces():
@@ -29,7 +28,7 @@ class Faces():
         r"""
         This is a virtual method.  Any class derived from :py:class:`Faces` must implement this function.
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.initialize not implemented"
         raise NotImplementedError(msg)
 
     def setLoad(self, pn, ps):
@@ -61,14 +60,14 @@ class Faces():
         r"""
         This is a virtual method.  Any class derived from :py:class:`Faces` must implement this function.
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.computeNodalForces not implemented"
         raise NotImplementedError(msg)
 
     def computeNodalFlux(self):
         r"""
         This is a virtual method.  Any class derived from :py:class:`Faces` must implement this function.
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.computeNodalFlux not implemented"
         raise NotImplementedError(msg)
 
     def isFace(self, X, N):
@@ -85,5 +84,5 @@ class Faces():
         :type N: np.array
         :return: **True** if **X** and **N** match this face. **False** otherwise.
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.isFace not implemented"
         raise NotImplementedError(msg)
@@ -34,7 +34,7 @@ class LinearElement(Element):
 
         :return:
         """
-        self.updateState()
+        self._ensureState()
         return self.Forces
 
 
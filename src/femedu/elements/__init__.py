@@ -11,6 +11,7 @@ Elements in this group share the following features:
 
 __all__ = (
     "Element",
+    "ElementBatch",
     "LinearElement",
     "DrawElement",
     "Faces",
@@ -23,5 +24,6 @@ from .Face2D import *
 from .Face3D import *
 from .DrawElement import *
 from .Element import *
+from .ElementBatch import *
 from .LinearElement import *
 
@@ -157,7 +157,7 @@ class Triangle6(LinearElement):
         """
         self.Loads = [ np.zeros_like(self.Forces[I]) for I in range(len(self.nodes)) ]
 
-        for I, face in enumerate(self.faces):
+        for I, face in enumerate(self._faces or ()):
             loads = face.computeNodalFlux()
 
             # indexing
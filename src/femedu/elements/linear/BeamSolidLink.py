@@ -51,13 +51,13 @@ class BeamSolidLink(Element):
         lm1_name = self.getUniqueLMName()
         lm2_name = self.getUniqueLMName()
 
-        dof_list_lead = ('ux', 'uy', 'rz')
-        dof_idx = frame_node.request(dof_list_lead, self)
-        self.dof_idx[frame_node] = dof_idx  # marked for removal
-
+        dof_list_lead   = ('ux', 'uy', 'rz')
         dof_list_follow = ('ux', 'uy', lm1_name, lm2_name)
-        dof_idx = plate_node.request(dof_list_follow, self)
-        self.dof_idx[plate_node] = dof_idx  # marked for removal
+
+        # nodes use d.o.f. lists of different length: unused entries are -1
+        self.dof_idx = np.full((2, len(dof_list_follow)), -1, dtype=np.int32)
+        self.dof_idx[0, :len(dof_list_lead)] = frame_node.request(dof_list_lead, self)
+        self.dof_idx[1, :] = plate_node.request(dof_list_follow, self)
 
         self._dof_list = (dof_list_lead, dof_list_follow)
 
@@ -18,6 +18,7 @@ from copy import deepcopy
 
 from ..Element import *
 from ...domain.Node import *
+from ...domain.NodePool import initial_positions, deformed_positions
 from ...utilities import QuadIntegration, QuadShapes
 
 class HRQuad(Element):
@@ -47,7 +48,6 @@ class HRQuad(Element):
         self._requestDofs(dof_list)
 
         self.distributed_load = [0.0, 0.0, 0.0, 0.0]   # face loads along the perimeter of the element
-        self.force    = 0.0
         self.Forces   = [ np.zeros(ndof) for k in range(len(self.nodes)) ]
         self.Kt       = [ [ np.zeros(ndof) for k in range(len(self.nodes)) ] for m in range(len(self.nodes)) ]
         self.ndof = ndof
@@ -58,7 +58,7 @@ class HRQuad(Element):
 
         self.Grad      = []   # derivative of shape functions with respect to global coords
 
-        X  = np.array([ node.getPos() for node in self.nodes ])
+        X  = initial_positions(self.nodes)
 
         # initialization step
         integrator = QuadIntegration(order=2)
@@ -150,7 +150,7 @@ class HRQuad(Element):
         Kt = [ [ np.zeros((ndof,ndof)) for i in range(nnds) ] for j in range(nnds) ]
 
         # create array of deformed nodal coordinates
-        xt = np.array([ node.getDeformedPos() for node in self.nodes ])
+        xt = deformed_positions(self.nodes)
 
         gpt = 0
 
@@ -220,7 +220,7 @@ class HRQuad(Element):
         """
         self.Loads = [ np.zeros_like(self.Forces[I]) for I in range(len(self.nodes)) ]
 
-        for I, face in enumerate(self.faces):
+        for I, face in enumerate(self._faces or ()):
             loads = face.computeNodalForces()
 
             # indexing
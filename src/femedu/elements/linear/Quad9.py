@@ -20,6 +20,7 @@ from copy import deepcopy
 
 from ..Element import *
 from ...domain.Node import *
+from ...domain.NodePool import initial_positions, deformed_positions
 from ...utilities import QuadIntegration, QuadShapes, GPdataType
 
 class Quad9(Element):
@@ -51,12 +52,11 @@ class Quad9(Element):
         self._requestDofs(dof_list)
 
         self.distributed_load = [0.0, 0.0, 0.0, 0.0]   # face loads along the perimeter of the element
-        self.force    = 0.0
         self.Forces   = [ np.zeros(ndof) for k in range(len(self.nodes)) ]
         self.Kt       = [ [ np.zeros((ndof,ndof)) for i in range(len(self.nodes)) ] for j in range(len(self.nodes)) ]
         self.ndof = ndof
 
-        X  = np.array([ node.getPos() for node in self.nodes ])
+        X  = initial_positions(self.nodes)
 
         # initialization step
         integrator = QuadIntegration(order=4)
@@ -152,8 +152,8 @@ class Quad9(Element):
         Kt = [ [ np.zeros((ndof,ndof)) for i in range(nnds) ] for j in range(nnds) ]
 
         # create array of undeformed and deformed nodal coordinates
-        xo = np.array([ node.getPos() for node in self.nodes ])
-        xt = np.array([ node.getDeformedPos() for node in self.nodes ])
+        xo = initial_positions(self.nodes)
+        xt = deformed_positions(self.nodes)
 
         gpt = 0
 
@@ -244,7 +244,7 @@ class Quad9(Element):
         """
         self.Loads = [ np.zeros_like(self.Forces[I]) for I in range(len(self.nodes)) ]
 
-        for I, face in enumerate(self.faces):
+        for I, face in enumerate(self._faces or ()):
             loads = face.computeNodalForces()
 
             # indexing
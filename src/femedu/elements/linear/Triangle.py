@@ -1,6 +1,7 @@
 import numpy as np
 from ..Element import *
 from ...domain.Node import *
+from ...domain.NodePool import deformed_positions
 
 class Triangle(Element):
     """
@@ -24,7 +25,6 @@ class Triangle(Element):
         self._requestDofs(dof_list)
 
         self.distributed_load = [0.0, 0.0, 0.0]
-        self.force    = 0.0
         self.Forces   = [ np.zeros(ndof) for k in range(len(self.nodes)) ]
         self.Kt       = [ [ np.zeros(ndof) for k in range(len(self.nodes)) ] for m in range(len(self.nodes)) ]
 
@@ -93,8 +93,9 @@ class Triangle(Element):
         guo = -gso - gto
 
         # covariant base vectors (current system)
-        gs = node1.getDeformedPos() - node0.getDeformedPos()
-        gt = node2.getDeformedPos() - node0.getDeformedPos()
+        x0, x1, x2 = deformed_positions(self.nodes[:3])
+        gs = x1 - x0
+        gt = x2 - x0
         gu = -gs - gt
 
         # metric (current system)
@@ -166,7 +167,7 @@ class Triangle(Element):
         """
         self.Loads = [ np.zeros_like(self.Forces[I]) for I in range(len(self.nodes)) ]
 
-        for I, face in enumerate(self.faces):
+        for I, face in enumerate(self._faces or ()):
             loads = face.computeNodalForces()
 
             # indexing
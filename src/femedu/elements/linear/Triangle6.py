@@ -3,6 +3,7 @@ from copy import deepcopy
 
 from ..Element import *
 from ...domain.Node import *
+from ...domain.NodePool import deformed_positions
 from ...utilities import TriangleShapes, TriangleIntegration, GPdataType
 
 class Triangle6(Element):
@@ -136,6 +137,9 @@ class Triangle6(Element):
         # initializes internal force and tangent stiffness to zero arrays of the appropriate size.
         self.reset_matrices()
 
+        # create array of deformed nodal coordinates
+        xt = deformed_positions(self.nodes)
+
         for xi, wi, gpData in zip(self.xis,self.wis,self.gpData):
 
             # grab pre-computed quantities
@@ -160,14 +164,9 @@ class Triangle6(Element):
             gto = self.gcov[1]
             gu0 = -gso - gto
 
-            # initialize covariant base vectors (current system) ...
-            gs = np.zeros_like(Gs)  #
-            gt = np.zeros_like(Gt)
-
-            # ... compute
-            for dN1, dN2, node in zip(dshape1, dshape2, self.nodes):
-                gs += dN1 * node.getDeformedPos(self)
-                gt += dN2 * node.getDeformedPos(self)
+            # covariant base vectors (current system)
+            gs = np.asarray(dshape1) @ xt
+            gt = np.asarray(dshape2) @ xt
             # gu = -gs - gt
 
             # deformation gradient
@@ -229,7 +228,7 @@ class Triangle6(Element):
         """
         self.Loads = [ np.zeros_like(self.Forces[I]) for I in range(len(self.nodes)) ]
 
-        for I, face in enumerate(self.faces):
+        for I, face in enumerate(self._faces or ()):
             loads = face.computeNodalForces()
 
             # indexing: face-ID matches the start node
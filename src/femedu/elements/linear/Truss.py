@@ -117,13 +117,31 @@ class Truss(Element):
         # kinematics
         eps = Nvec @ (U1 - U0) / L
 
+        # constitutive
+        self.force, EA = self._sectionResponse(eps)
+
+        # nodal forces
+        Pe = self.force * Nvec
+        self.Forces = [-Pe, Pe]
+
+        # nodal and element tangent stiffness matrix
+        ke = (EA / L) * np.outer(Nvec, Nvec)
+        self.Kt = [[ke, -ke], [-ke, ke]]
+
+    def _sectionResponse(self, eps):
+        r"""
+        Update the material state for axial strain **eps** (internal use).
+
+        :param eps: axial strain
+        :returns: tuple :code:`(force, EA)` of axial force and axial tangent stiffness
+        """
         if self.material.materialType() == Material.SECTION1D:
             # constitutive
             self.material.setStrain({'axial':eps})
 
             # stress resultant
             stress = self.material.getStress()
-            self.force = stress['axial']
+            force  = stress['axial']
 
             # section tangent stiffness matrix
             Et = self.material.getStiffness()
@@ -135,18 +153,57 @@ class Truss(Element):
             sig = stress['xx']
 
             # stress resultant
-            area   = self.material.getArea()
-            self.force = sig * area
+            area  = self.material.getArea()
+            force = sig * area
 
             # section tangent stiffness matrix
             Et = self.material.getStiffness()
             EA = Et * area
 
+        return force, EA
+
+    @classmethod
+    def _batchState(cls, batch):
+        r"""
+        Compute internal forces and tangent stiffness for all trusses of an :py:class:`ElementBatch` (internal use).
+
+        :param batch: an :py:class:`ElementBatch` of :py:class:`Truss` elements
+        """
+        L    = np.array([ element.L0   for element in batch.elements ])
+        Nvec = np.array([ element.Nvec for element in batch.elements ])
+
+        # kinematics
+        U   = batch.getDisp()
+        eps = np.einsum('ei,ei->e', Nvec, U[:, 1] - U[:, 0]) / L
+
+        # constitutive
+        materials = [ element.material for element in batch.elements ]
+        mat_class = type(materials[0])
+
+        if materials[0].isMaterialType(Material.FIBER) and \
+                all(type(material) is mat_class for material in materials):
+            # all materials of the batch are updated in a single call
+            sig, Et = mat_class.setStrainBatch(materials, eps)
+            area  = np.array([ material.getArea() for material in materials ])
+            force = sig * area
+            EA    = Et * area
+            for element, f in zip(batch.elements, force):
+                element.force = f
+        else:
+            force = np.empty(batch.nelem)
+            EA    = np.empty(batch.nelem)
+            for k, element in enumerate(batch.elements):
+                force[k], EA[k] = element._sectionResponse(eps[k])
+                element.force   = force[k]
+
         # nodal forces
-        Pe = self.force * Nvec
-        self.Forces = [-Pe, Pe]
+        Pe = force[:, np.newaxis] * Nvec
+        batch.Forces[:, 0] = -Pe
+        batch.Forces[:, 1] =  Pe
 
         # nodal and element tangent stiffness matrix
-        ke = (EA / L) * np.outer(Nvec, Nvec)
-        self.Kt = [[ke, -ke], [-ke, ke]]
-
+        ke = (EA / L)[:, np.newaxis, np.newaxis] * np.einsum('ei,ej->eij', Nvec, Nvec)
+        batch.Kt[:, 0, 0] =  ke
+        batch.Kt[:, 0, 1] = -ke
+        batch.Kt[:, 1, 0] = -ke
+        batch.Kt[:, 1, 1] =  ke
@@ -7,6 +7,8 @@ class DiffusionGeneral(Material):
 
     Use subclasses :py:class:`Thermal`, :py:class:`Seapage`, etc., for actual analyses.
     """
+
+    __slots__ = ('gradPhi', 'flux')
     
     def __init__(self, params={'diffusivity':1., 'capacity':1., 'density':1., 'thickness':1.}):
         super(DiffusionGeneral, self).__init__(params)
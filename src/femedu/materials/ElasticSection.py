@@ -1,6 +1,8 @@
 from .SectionMaterial import *
 
 class ElasticSection(SectionMaterial):
+
+    __slots__ = ()
     
     def __init__(self, params={}):
         super(ElasticSection, self).__init__(params)
@@ -2,6 +2,39 @@ import matplotlib.pyplot as plt
 
 from .Material import *
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def _fiber_update(eps, E, fy, plastic_strain):
+    r"""
+    return mapping for many fibers at once (internal use, see :py:meth:`FiberMaterial.setStrainBatch`)
+
+    All arguments are arrays holding one entry per fiber.
+
+    :returns: tuple :code:`(sig, Et, plastic_strain)` of stress, tangent stiffness, and updated plastic strain
+    """
+    # elastic predictor
+    sig = E * (eps - plastic_strain)
+
+    # check yield condition
+    f = np.abs(sig) - fy
+
+    # plastic corrector as needed
+    plastic = f >= 0.0
+    depsP = np.where(plastic, np.sign(sig) * f/E, 0.0)
+    sig   = sig - E * depsP
+    Et    = np.where(plastic, 0.0, E)
+
+    return sig, Et, plastic_strain + depsP
+
+
+if HAS_NUMBA:
+    _fiber_update = njit(cache=True)(_fiber_update)
+
 
 class FiberMaterial(Material):
     """
@@ -9,6 +42,8 @@ class FiberMaterial(Material):
 
     """
 
+    __slots__ = ('plastic_strain',)
+
     def __init__(self, params={'E':1.0, 'A':1.0, 'nu':0.0, 'fy':1.0e30}):
         super().__init__(params = params)
 
@@ -29,7 +64,7 @@ class FiberMaterial(Material):
         self.setStrain({'xx':0.0})
 
     def getArea(self):
-        return self.parameters['A']
+        return self.A
 
     def updateState(self):
         """
@@ -39,8 +74,8 @@ class FiberMaterial(Material):
         :return: n/a
         """
         # update stress state
-        E  = self.parameters['E']
-        fy = self.parameters['fy']
+        E  = self.E
+        fy = self.fy
 
         eps = self.strain['xx']
 
@@ -63,8 +98,42 @@ class FiberMaterial(Material):
         #print(4*'{:12.8e}  '.format(eps, f, self.plastic_strain, self.sig ))
         self.stress = {'xx':self.sig, 'yy':0.0, 'zz':0.0, 'xy':0.0, 'xy':0.0, 'xy':0.0}
 
+    @classmethod
+    def setStrainBatch(cls, materials, eps):
+        r"""
+        update the state of many fiber materials in a single call, e.g., for a batch of truss elements
+
+        Equivalent to calling :code:`materials[k].setStrain({'xx':eps[k]})` for every **k**.
+        Uses a compiled kernel if :code:`numba` is available.  Subclasses overloading :code:`updateState()`
+        are updated one material at a time.
+
+        :param materials: sequence of :py:class:`FiberMaterial` objects
+        :param eps: array of axial strains, one per material
+        :return: tuple :code:`(sig, Et)` of float arrays holding axial stress and tangent stiffness for every material
+        """
+        if cls.updateState is not FiberMaterial.updateState:
+            return super().setStrainBatch(materials, eps)
+
+        eps = np.asarray(eps, dtype=np.float64)
+        E   = np.array([ material.E for material in materials ])
+        fy  = np.array([ material.fy for material in materials ])
+        ep  = np.array([ material.plastic_strain for material in materials ], dtype=np.float64)
+
+        sig, Et, ep = _fiber_update(eps, E, fy, ep)
+
+        for k, material in enumerate(materials):
+            if Et[k] != E[k]:
+                print("material entering plastic state")
+            material.strain = {'xx':eps[k]}
+            material.sig = sig[k]
+            material.Et  = Et[k]
+            material.plastic_strain = ep[k]
+            material.stress = {'xx':sig[k], 'yy':0.0, 'zz':0.0, 'xy':0.0, 'xy':0.0, 'xy':0.0}
+
+        return sig, Et
+
     def getStrain(self):
-        return self.sig / self.parameters['E'] + self.plastic_strain
+        return self.sig / self.E + self.plastic_strain
 
 
 if __name__ == "__main__":
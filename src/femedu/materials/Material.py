@@ -29,6 +29,7 @@ class Material():
     HARDENING   = 0x080000
     DIFFUSION   = 0x100000
 
+    __slots__ = ('_type', 'parameters', 'E', 'A', 'nu', 'fy', 'sig', 'Et', 'strain', 'stress')
 
     def __init__(self, params={'E':1.0, 'A':1.0, 'nu':0.0, 'fy':1.0e30}):
         """
@@ -49,8 +50,29 @@ class Material():
         if 'fy' not in self.parameters:
             self.parameters['fy'] = 1.0e30
 
+        self._syncParameters()
+
         self.sig = 0.0
-        self.Et  = self.parameters['E']
+        self.Et  = self.E
+
+    def setParameters(self, params):
+        r"""
+        Update material parameters.  Use this method rather than editing :code:`self.parameters`
+        directly, so that the attributes **E**, **A**, **nu** and **fy** stay in sync.
+
+        :param params: dict of parameter names and values
+        """
+        self.parameters.update(params)
+        self._syncParameters()
+
+    def _syncParameters(self):
+        r"""
+        copy the common parameters into attributes for fast access in :code:`updateState()` (internal use)
+        """
+        self.E  = float(self.parameters['E'])
+        self.A  = float(self.parameters['A'])
+        self.nu = float(self.parameters['nu'])
+        self.fy = float(self.parameters['fy'])
 
     def __str__(self):
         s = "{}(Material)({})".format(self.__class__.__name__, self.parameters)
@@ -91,6 +113,28 @@ class Material():
         self.strain = eps
         self.updateState()
 
+    @classmethod
+    def setStrainBatch(cls, materials, eps):
+        r"""
+        update the state of many uniaxial materials in a single call, e.g., for a batch of truss elements
+
+        This is equivalent to calling :code:`materials[k].setStrain({'xx':eps[k]})` for every **k**
+        and collecting the axial stress and tangent stiffness.  Materials may overload this method
+        with a vectorized implementation.
+
+        :param materials: sequence of materials of this class
+        :param eps: array of axial strains, one per material
+        :return: tuple :code:`(sig, Et)` of float arrays holding axial stress and tangent stiffness for every material
+        """
+        sig = np.empty(len(materials))
+        Et  = np.empty(len(materials))
+        for k, material in enumerate(materials):
+            material.setStrain({'xx':eps[k]})
+            sig[k] = material.getStress()['xx']
+            Et[k]  = material.getStiffness()
+
+        return sig, Et
+
     def updateState(self):
         raise NotImplementedError(self.__class__.__name__ + '.updateState() needs to be overloaded')
 
@@ -6,6 +6,8 @@ class PlaneStrain(Material):
 
     """
 
+    __slots__ = ('plastic_strain',)
+
     def __init__(self, params={'E':1.0, 't':1.0, 'nu':0.0, 'fy':1.0e30}):
         super().__init__(params = params)
 
@@ -34,10 +36,10 @@ class PlaneStrain(Material):
         self.strain = np.array([eps['xx'],eps['yy'],eps['xy']])
 
         # update stress state
-        E  = self.parameters['E']
+        E  = self.E
         t  = self.parameters['t']
-        nu = self.parameters['nu']
-        fy = self.parameters['fy']
+        nu = self.nu
+        fy = self.fy
 
         # default consistency parameter
         gamma = 0.0
@@ -72,13 +74,13 @@ class PlaneStrain(Material):
         #print(4*'{:12.8e}  '.format(eps, f, self.plastic_strain, self.sig ))
 
     def getStrain(self):
-        return self.sig / self.parameters['E'] + self.plastic_strain
+        return self.sig / self.E + self.plastic_strain
 
     def updateState(self):
         # update state now that the global analysis has converged
-        E  = self.parameters['E']
+        E  = self.E
         t  = self.parameters['t']
-        nu = self.parameters['nu']
+        nu = self.nu
 
         Cinv = 1 / (E * t) * np.array([[1., -nu, 0.], [-nu, 1., 0.], [0., 0., 2. * (1. + nu)]])
         self.plastic_strain = self.strain - Cinv @ self.sig
@@ -6,6 +6,8 @@ class PlaneStress(Material):
 
     """
 
+    __slots__ = ('total_strain', 'plastic_strain')
+
     def __init__(self, params={'E':1.0, 't':1.0, 'nu':0.0, 'fy':1.0e30}):
         super().__init__(params = params)
 
@@ -35,10 +37,10 @@ class PlaneStress(Material):
         eps = np.array([self.strain['xx'], self.strain['yy'], self.strain['xy']])
 
         # update stress state
-        E  = self.parameters['E']
+        E  = self.E
         t  = self.parameters['t']
-        nu = self.parameters['nu']
-        fy = self.parameters['fy']
+        nu = self.nu
+        fy = self.fy
 
         # default consistency parameter
         gamma = 0.0
@@ -51,7 +53,7 @@ class PlaneStress(Material):
         # elastic predictor
         stress = self.Et @ ( eps - self.plastic_strain )
 
-        self.strain['zz'] = -self.parameters['nu'] * (eps[0] + eps[1])  # elastic thickness strain
+        self.strain['zz'] = -self.nu * (eps[0] + eps[1])  # elastic thickness strain
 
         # check yield condition
         (sxx, syy, sxy) = stress
@@ -84,9 +86,9 @@ class PlaneStress(Material):
 
     def converged(self):
         # update state now that the global analysis has converged
-        E  = self.parameters['E']
+        E  = self.E
         t  = self.parameters['t']
-        nu = self.parameters['nu']
+        nu = self.nu
 
         Cinv = 1 / (E * t) * np.array([[1., -nu, 0.], [-nu, 1., 0.], [0., 0., 2. * (1. + nu)]])
         self.plastic_strain = self.total_strain - Cinv @ self.sig
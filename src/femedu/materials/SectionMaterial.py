@@ -7,6 +7,8 @@ class SectionMaterial(Material):
 
     """
 
+    __slots__ = ('plastic_strain',)
+
     def __init__(self, params={'E':1.0, 'A':1.0, 'I':1.0, 'nu':0.0, 'fy':1.0e30}):
         super().__init__(params = params)
 
@@ -30,8 +32,8 @@ class SectionMaterial(Material):
         self.updateState()
 
     def updateState(self):
-        EA = self.parameters['E']*self.parameters['A']
-        EI = self.parameters['E']*self.parameters['I']
+        EA = self.E*self.A
+        EI = self.E*self.parameters['I']
 
         if 'axial' in self.strain:
             force = EA * self.strain['axial']
@@ -23,6 +23,8 @@ class Thermal(DiffusionGeneral):
     :param params: isotropic thermal properties
     :type params: dict
     """
+
+    __slots__ = ()
     
     def __init__(self, params={'conductivity':1., 'specific_heat':1., 'density':1., 'thickness':1.}):
 
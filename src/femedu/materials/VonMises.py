@@ -10,6 +10,8 @@ class VonMises(Material):
 
     """
 
+    __slots__ = ('plastic_strain', 'plastic_strain1', 'alpha', 'alpha1', 'beta', 'beta1')
+
     def __init__(self, params={'E':1.0, 'nu':0.0, 'fy':1.0e30}):
         super().__init__(params = params)
 
@@ -42,9 +44,9 @@ class VonMises(Material):
         """
 
         # update stress state
-        E  = self.parameters['E']
-        nu = self.parameters['nu']
-        fy = self.parameters['fy']
+        E  = self.E
+        nu = self.nu
+        fy = self.fy
         H  = self.parameters['H']   # kinematic hardening parameter
         K  = self.parameters['K']   # isotropic hardening parameter
         twoG  = E / (1 + nu)
@@ -112,7 +114,7 @@ class VonMises(Material):
             self.Et  = Cep
 
     def getStrain(self):
-        return self.sig / self.parameters['E'] + self.plastic_strain
+        return self.sig / self.E + self.plastic_strain
 
     def converged(self):
         # update state now that the global analysis has converged
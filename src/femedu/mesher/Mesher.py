@@ -1,4 +1,3 @@
-import sys
 import numpy as np
 from copy import deepcopy
 
@@ -31,7 +30,7 @@ class Mesher():
         :param element_type: compatible element type
         :param material: a material object
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.lineMesh not implemented"
         raise NotImplementedError(msg)
 
     def quadMesh(self, NeX, NeY, element_type, material, **kwargs):
@@ -45,7 +44,7 @@ class Mesher():
         :param element_type: compatible element type
         :param material: a material object
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.quadMesh not implemented"
         raise NotImplementedError(msg)
 
     def triangleMesh(self, NeX, NeY, element_type, material, **kwargs):
@@ -59,7 +58,7 @@ class Mesher():
         :param element_type: compatible element type
         :param material: a material object
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.triangleMesh not implemented"
         raise NotImplementedError(msg)
 
     def brickMesh(self, NeX, NeY, NeZ, element_type, material, **kwargs):
@@ -74,7 +73,7 @@ class Mesher():
         :param element_type: compatible element type
         :param material: a material object
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.brickMesh not implemented"
         raise NotImplementedError(msg)
 
     def tetMesh(self, NeX, NeY, NeZ, element_type, material, **kwargs):
@@ -89,7 +88,7 @@ class Mesher():
         :param element_type: compatible element type
         :param material: a material object
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.tetMesh not implemented"
         raise NotImplementedError(msg)
 
     def tie(self, other, tol=1.0e-3):
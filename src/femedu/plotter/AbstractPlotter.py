@@ -44,7 +44,7 @@ class AbstractPlotter():
 
         :param disp:
         """
-        msg = "** WARNING ** {}.{} marked deprecated".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.setDisplacements marked deprecated"
         raise DeprecationWarning(msg)
 
     def setValues(self, vals):
@@ -52,7 +52,7 @@ class AbstractPlotter():
 
         :param vals:
         """
-        msg = "** WARNING ** {}.{} marked deprecated".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.setValues marked deprecated"
         raise DeprecationWarning(msg)
 
     def setReactions(self, R):
@@ -85,7 +85,7 @@ class AbstractPlotter():
         :param factor: displacement magnification factor
         :param file: filename (str)
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.displacementPlot not implemented"
         raise NotImplementedError(msg)
 
     def valuePlot(self, variable_name='', deformed=False, file=None):
@@ -99,7 +99,7 @@ class AbstractPlotter():
         :param deformed: True | **False**
         :param file: filename (str)
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.valuePlot not implemented"
         raise NotImplementedError(msg)
 
     def beamValuePlot(self, variable_name='', factor=0.0, file=None):
@@ -113,7 +113,7 @@ class AbstractPlotter():
         :param factor: displacement scaling factor
         :param file: filename (str)
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.beamValuePlot not implemented"
         raise NotImplementedError(msg)
 
     def addForces(self, axs):
@@ -122,7 +122,7 @@ class AbstractPlotter():
 
         :param axs: axis on which to plot
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.addForces not implemented"
         raise NotImplementedError(msg)
 
     def set_axes_equal(self, ax):
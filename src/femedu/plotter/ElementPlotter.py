@@ -6,10 +6,9 @@ from matplotlib.colors import ListedColormap, BoundaryNorm
 from matplotlib.patches import Arc, FancyArrow
 import matplotlib.tri as tri
 
-import sys
-
 from .AbstractPlotter import *
 from ..elements.Element import Element
+from ..domain.NodePool import deformed_positions
 
 class ElementPlotter(AbstractPlotter):
     r"""
@@ -216,7 +215,7 @@ class ElementPlotter(AbstractPlotter):
             kwargs['linewidth'] = 0.125
 
         if self.plot3D:
-            print("** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name))
+            print(f"** WARNING ** {type(self).__name__}.valuePlot not implemented")
             return
 
         else:
@@ -520,9 +519,10 @@ class ElementPlotter(AbstractPlotter):
             Fx=[]
             Fy=[]
 
-            for (node, force) in zip(self.nodes, self.loads):
+            points = deformed_positions(self.nodes, factor=factor)
+
+            for (point, force) in zip(points, self.loads):
                 if np.linalg.norm(force) > 1.0e-3:
-                    point = node.getDeformedPos(factor=factor)
                     X.append(point[0])
                     if point.size>1:
                         Y.append(point[1])
@@ -566,9 +566,10 @@ class ElementPlotter(AbstractPlotter):
             Fx=[]
             Fy=[]
 
-            for (node, force) in zip(self.nodes, self.reactions):
+            points = deformed_positions(self.nodes, factor=factor)
+
+            for (point, force) in zip(points, self.reactions):
                 if np.linalg.norm(force) > 1.0e-3:
-                    point = node.getDeformedPos(factor=factor)
                     X.append(point[0])
                     Y.append(point[1])
                     Fx.append(-force[0])
@@ -3,10 +3,18 @@ import numpy as np
 class Record():
     """
     container class for recording time history data
+
+    Values are stored in a preallocated array that doubles its capacity whenever it is full.
+    Once a value does not match the shape of previous values (or is not numeric),
+    the record falls back to a plain list.
     """
 
+    CAPACITY = 64   # initial number of entries
+
     def __init__(self, key='', label=''):
-        self.data  = []
+        self._buf  = np.empty(0)   # allocated by the first call to addData()
+        self._n    = 0
+        self._list = None          # list storage for values of inconsistent shape
         self.key   = key
         self.label = label
 
@@ -28,7 +36,59 @@ class Record():
         """
         :return: the length of the collected data array
         """
-        return len(self.data)
+        if self._list is not None:
+            return len(self._list)
+        return self._n
+
+    @property
+    def data(self):
+        """
+        the collected data: an array view, or a list if values of inconsistent shape were added
+        """
+        if self._list is not None:
+            return self._list
+        return self._buf[:self._n]
+
+    @data.setter
+    def data(self, values):
+        self.reset()
+        for value in values:
+            self.addData(value)
+
+    def addData(self, value):
+        """
+        Append one value to the record.
+
+        :param value: a scalar or array
+        """
+        if self._list is not None:
+            self._list.append(value)
+            return
+
+        try:
+            array = np.asarray(value, dtype=np.float64)
+        except (TypeError, ValueError):
+            array = None
+
+        if array is None or (self._n and self._buf.shape[1:] != array.shape):
+            self._list = list(self._buf[:self._n]) + [value]
+            return
+
+        value = array
+        if self._n == 0 and (not self._buf.shape[0] or self._buf.shape[1:] != value.shape):
+            self._buf = np.empty((self.CAPACITY, *value.shape))
+        elif self._n == self._buf.shape[0]:
+            self._buf = np.resize(self._buf, (2 * self._buf.shape[0], *self._buf.shape[1:]))
+
+        self._buf[self._n] = value
+        self._n += 1
+
+    def reset(self):
+        """
+        wipe all collected data
+        """
+        self._n    = 0
+        self._list = None
 
     def isKey(self, key):
         return (key and key == self.key)
@@ -37,4 +97,6 @@ class Record():
         """
         :return: tuple (label, data.asarray())
         """
-        return (self.label, np.array(self.data))
+        if self._list is not None:
+            return (self.label, np.array(self._list))
+        return (self.label, self._buf[:self._n].copy())
@@ -163,9 +163,9 @@ class Recorder():
         """
         for var in self.data:
             if var in dta:
-                self.data[var].data.append(dta[var])
+                self.data[var].addData(dta[var])
             else:
-                self.data[var].data.append(np.nan)
+                self.data[var].addData(np.nan)
                 print(f"Recorder.addData: '{var}' not not in data set: padding with nan")
 
         for var in dta:
@@ -203,7 +203,7 @@ class Recorder():
         """
         self.active = False
         for var in self.data:
-            self.data[var] = []
+            self.data[var].reset()
 
     def export(self, filename='unknown.txt'):
         """
@@ -69,9 +69,7 @@ class LinearSolver(Solver):
         self.U = dU
 
         # update nodal displacements
-        for node in self.nodes:
-            idxK = node.getIdx4DOFs()
-            node._updateDisp(dU[idxK])
+        self._updateDisp(dU)
 
 
     def assemble(self, force_only=False):
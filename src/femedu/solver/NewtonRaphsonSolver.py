@@ -109,9 +109,7 @@ class NewtonRaphsonSolver(Solver):
             dU = np.linalg.solve(self.Kt, self.R)
 
         # update nodal displacements
-        for node in self.nodes:
-            idxK = node.getIdx4DOFs()
-            node._updateDisp(dU[idxK])
+        self._updateDisp(dU)
 
     def assemble(self, force_only=False):
         r"""
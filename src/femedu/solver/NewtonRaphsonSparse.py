@@ -63,9 +63,7 @@ class NewtonRaphsonSolverSparse(NewtonRaphsonSolver):
             # print(dU)
 
         # update nodal displacements
-        for node in self.nodes:
-            idxK = node.getIdx4DOFs()
-            node._updateDisp(dU[idxK])
+        self._updateDisp(dU)
 
 
     def assemble(self, force_only=False):
@@ -87,10 +85,14 @@ class NewtonRaphsonSolverSparse(NewtonRaphsonSolver):
         :param force_only: set to **True** if only the residual force needs to be assembled
         """
         # compute size parameters
+        dofmap = self._getDofMap()
+
         ndof = 0
+        starts = np.zeros(dofmap.pool.count, dtype=np.intp)
         for node in self.nodes:
             if node.isLead():
                 node.setStart(ndof)
+                starts[node._row] = ndof
                 ndof += node.ndofs
 
         for constraint in self.constraints:
@@ -127,6 +129,12 @@ class NewtonRaphsonSolverSparse(NewtonRaphsonSolver):
                 idx = node.getIdx4DOFs()
                 Psys[idx] += node.getLoad()
 
+        # global dof indices for all elements in one pass
+        gidx, _, _ = dofmap.gather(starts)
+
+        # state update for element types supporting batch evaluation
+        self._updateBatches()
+
         # Element Loop: assemble element forces and stiffness
         for element in self.elements:
 
@@ -136,9 +144,10 @@ class NewtonRaphsonSolverSparse(NewtonRaphsonSolver):
             if not force_only:
                 Ke = element.getStiffness() # fetch element stiffness matrix as array of nodal matrices
 
-            for (i,ndI) in enumerate(element.nodes):
-                # fetch dof mapping for node I
-                idxK = ndI.getIdx4Element(element)
+            # dof mapping for all nodes of this element
+            idx = dofmap.elementIndex(gidx, element)
+
+            for (i,idxK) in enumerate(idx):
 
                 # system reference load vector
                 if isinstance(Pe[i], np.ndarray):
@@ -150,9 +159,7 @@ class NewtonRaphsonSolverSparse(NewtonRaphsonSolver):
 
                 # system tangent stiffness matrix
                 if not force_only:
-                    for (j,ndJ) in enumerate(element.nodes):
-                        # fetch dof mapping for node J
-                        idxM = ndJ.getIdx4Element(element)
+                    for (j,idxM) in enumerate(idx):
                         # add to system matrix
                         rows += idxK.repeat(len(idxM)).flatten().tolist()
                         cols += idxM.tolist()*len(idxK)
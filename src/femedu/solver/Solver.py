@@ -1,9 +1,12 @@
-import sys
 import numpy as np
 import scipy as sc
 
 import matplotlib.pyplot as plt
 
+from ..domain.DofMap import DofMap, scatter_add
+from ..domain.NodePool import NodePool
+from ..elements.ElementBatch import ElementBatch
+
 class Solver():
     r"""
     Abstract class for any solver implementation.
@@ -27,6 +30,8 @@ class Solver():
         self.nodes       = []       # list of node pointers
         self.constraints = []       # list of constraint pointers
         self.sdof = 0               # number of DOFs in the current system
+        self._dofmap = None         # flattened element dof maps (see DofMap)
+        self._batches = None        # batches of elements evaluated in a single pass (see ElementBatch)
 
         # numeric iteration tolerance
         self.TOL = 1.0e-6
@@ -152,7 +157,7 @@ class Solver():
         r"""
         activate displacement control for the next load step
         """
-        if dof in node.dofs:
+        if node.hasDOF(dof):
             self.hasConstraint = True
             self.control_node  = node
             self.control_dof   = dof
@@ -182,11 +187,15 @@ class Solver():
         :param force_only: set to **True** if only the residual force needs to be assembled
         """
 
+        dofmap = self._getDofMap()
+
         # compute size parameters
         ndof = 0
+        starts = np.zeros(dofmap.pool.count, dtype=np.intp)
         for node in self.nodes:
             if node.isLead():
                 node.setStart(ndof)
+                starts[node._row] = ndof
                 ndof += node.ndofs
 
         for constraint in self.constraints:
@@ -217,6 +226,16 @@ class Solver():
                 idx = node.getIdx4DOFs()
                 Psys[idx] += node.getLoad()
 
+        # global dof indices for all elements in one pass
+        gidx, _, _ = dofmap.gather(starts)
+
+        # state update for element types supporting batch evaluation
+        self._updateBatches()
+
+        # nodal element forces and loads, stacked in the order of gidx
+        F_blocks = []
+        P_blocks = []
+
         # Element Loop: assemble element forces and stiffness
         for element in self.elements:
 
@@ -226,26 +245,31 @@ class Solver():
             if not force_only:
                 Ke = element.getStiffness() # fetch element stiffness matrix as array of nodal matrices
 
-            for (i,ndI) in enumerate(element.nodes):
-                # fetch dof mapping for node I
-                idxK = ndI.getIdx4Element(element)
+            # dof mapping for all nodes of this element
+            idx = dofmap.elementIndex(gidx, element)
+
+            for (i,idxK) in enumerate(idx):
 
                 # system reference load vector
                 if isinstance(Pe[i], np.ndarray):
-                    # assemble the load vector
-                    Psys[idxK] += Pe[i]
+                    P_blocks.append(np.broadcast_to(Pe[i], idxK.shape))
+                else:
+                    P_blocks.append(np.zeros(idxK.shape))
 
                 # system residual force vector
-                Fsys[idxK] += Fe[i]
+                F_blocks.append(np.broadcast_to(Fe[i], idxK.shape))
 
                 # system tangent stiffness matrix
                 if not force_only:
-                    for (j,ndJ) in enumerate(element.nodes):
-                        # fetch dof mapping for node J
-                        idxM = ndJ.getIdx4Element(element)
+                    for (j,idxM) in enumerate(idx):
                         # add to system matrix
                         Ksys[idxK[:, np.newaxis], idxM] += Ke[i][j]
 
+        # scatter all element contributions at once
+        if F_blocks:
+            scatter_add(Psys, gidx, np.concatenate(P_blocks))
+            scatter_add(Fsys, gidx, np.concatenate(F_blocks))
+
         # system residual force vector
         self.P = Psys
         self.R = self.loadfactor * Psys - Fsys
@@ -253,8 +277,8 @@ class Solver():
         # apply boundary conditions
         if not force_only:
             for node in self.nodes:
-                for dof in node.dofs:
-                    if node.isFixed(dof):
+                for dof in node.getFixedDofs():
+                    if node.hasDOF(dof):
                         #idx = node.lead.start + node.dofs[dof]
                         idx = node.getIdx4DOFs(dofs=[dof])[0]
 
@@ -269,22 +293,58 @@ class Solver():
 
             self.Kt = Ksys
 
+    def _getDofMap(self):
+        r"""
+        :returns: the flattened element dof map, rebuilt whenever the model has changed (internal use)
+        """
+        dofmap = self._dofmap
+        if dofmap is None or not dofmap.isCurrent(self.elements, self.nodes):
+            pool = self.nodes[0]._pool if self.nodes else NodePool()
+            dofmap = DofMap(self.elements, pool, self.nodes)
+            self._dofmap  = dofmap
+            self._batches = None
+        return dofmap
+
+    def _updateBatches(self):
+        r"""
+        Update the state of all elements supporting batch evaluation (internal use).
+
+        Batches are rebuilt whenever the dof map is rebuilt.  Updated elements skip their
+        own state update in the subsequent :code:`getForce()` and :code:`getStiffness()` calls.
+        """
+        self._getDofMap()
+        if self._batches is None:
+            self._batches = ElementBatch.group(self.elements, supported_only=True)
+
+        for batch in self._batches:
+            batch.update()
+
+    def _updateDisp(self, dU):
+        r"""
+        Add the global displacement correction **dU** to all nodes (internal use)
+
+        The global numbering follows :py:meth:`assemble`.
+
+        :param dU: global displacement correction vector
+        """
+        self._getDofMap().updateDisp(dU)
+
     def solve(self, **kwargs):
         """
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.solve not implemented"
         raise NotImplementedError(msg)
 
     def initialize(self):
         """
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.initialize not implemented"
         raise NotImplementedError(msg)
 
     def reset(self):
         """
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.reset not implemented"
         raise NotImplementedError(msg)
 
     def on_converged(self):
@@ -464,11 +524,11 @@ class Solver():
 
             reaction = np.zeros(3)
 
-            if 'ux' in node.dofs:
+            if node.hasDOF('ux'):
                 reaction[0] = self.R[node.getIdx4DOFs(dofs=['ux'])]
-            if 'uy' in node.dofs:
+            if node.hasDOF('uy'):
                 reaction[1] = self.R[node.getIdx4DOFs(dofs=['uy'])]
-            if 'rz' in node.dofs:
+            if node.hasDOF('rz'):
                 reaction[2] = self.R[node.getIdx4DOFs(dofs=['rz'])]
 
             if np.linalg.norm(reaction) <= cut_off:
@@ -522,14 +582,14 @@ class Solver():
         r"""
         This method may be implemented by a nonlinear solver
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.initArcLength not implemented"
         raise NotImplementedError(msg)
 
     def stepArcLength(self, verbose=False):
         r"""
         This method may be implemented by a nonlinear solver
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.stepArcLength not implemented"
         raise NotImplementedError(msg)
 
     def startRecorder(self):
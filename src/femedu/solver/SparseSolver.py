@@ -146,6 +146,9 @@ class SparseSolver(NewtonRaphsonSolver):
                 idx = node.start + np.arange(node.ndofs)
                 Rsys[idx] += node.getLoad() * self.loadfactor
 
+        # state update for element types supporting batch evaluation
+        self._updateBatches()
+
         # Element Loop: assemble element forces and stiffness
         for element in self.elements:
             Fe = element.getForce()     # Element State Update occurs here
@@ -1,4 +1,3 @@
-import sys
 import numpy as np
 
 from .ShapeFunctions import ShapeFunctions
@@ -180,7 +179,7 @@ class QuadShapes(ShapeFunctions):
             PHI = phi_s*phi_t  # this is an element-by element multiplication
 
         else:
-            msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+            msg = f"** WARNING ** {type(self).__name__}.shape not implemented"
             raise NotImplementedError(msg)
 
         return PHI
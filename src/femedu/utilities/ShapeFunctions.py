@@ -34,7 +34,7 @@ class ShapeFunctions():
            by any subclass
 
         """
-        msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+        msg = f"** WARNING ** {type(self).__name__}.shape not implemented"
         raise NotImplementedError(msg)
 
 
@@ -1,4 +1,3 @@
-import sys
 import numpy as np
 
 from .ShapeFunctions import ShapeFunctions
@@ -90,7 +89,7 @@ class TriangleShapes(ShapeFunctions):
                 PHI = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0])
 
         else:
-            msg = "** WARNING ** {}.{} not implemented".format(self.__class__.__name__, sys._getframe().f_code.co_name)
+            msg = f"** WARNING ** {type(self).__name__}.shape not implemented"
             raise NotImplementedError(msg)
 
         return PHI
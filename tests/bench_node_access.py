@@ -0,0 +1,38 @@
+"""
+Timing of frequently used Node accessors.
+
+Run as :code:`python tests/bench_node_access.py` on two checkouts to compare revisions.
+"""
+import timeit
+
+from femedu.domain import Node
+from femedu.elements.linear import Truss
+from femedu.materials import FiberMaterial
+
+
+def main(number=100000, repeat=7):
+    nd0 = Node(0.0, 0.0)
+    nd1 = Node(3.0, 0.0)
+    elem = Truss(nd0, nd1, FiberMaterial())
+    nd0.fixDOF('ux')
+    nd1.setDisp([0.1, 0.2])
+    nd1.setLoad([1.0, 2.0], ['ux', 'uy'])
+
+    cases = [
+        ("Node.getDisp(dofs=('uy',))",     lambda: nd1.getDisp(dofs=('uy',))),
+        ("Node.getDisp(dofs=('ux','uy'))", lambda: nd1.getDisp(dofs=('ux', 'uy'))),
+        ("Node.getDisp(caller=elem)",      lambda: nd1.getDisp(caller=elem)),
+        ("Node.getDisp()",                 lambda: nd1.getDisp()),
+        ("Node.hasDOF('uy')",              lambda: nd1.hasDOF('uy')),
+        ("Node.isFixed('ux')",             lambda: nd0.isFixed('ux')),
+        ("Node.getLoad()",                 lambda: nd1.getLoad()),
+        ("Node(0., 0.)",                   lambda: Node(0.0, 0.0)),
+    ]
+
+    for label, func in cases:
+        t = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+        print(f"{label:36s} {t*1.0e6:8.3f} us")
+
+
+if __name__ == "__main__":
+    main()
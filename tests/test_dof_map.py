@@ -0,0 +1,118 @@
+import numpy as np
+
+from femedu.domain import Node
+from femedu.domain.DofMap import DofMap, gather, scatter_add
+from femedu.elements.linear import Truss, Beam2D
+from femedu.materials import FiberMaterial, ElasticSection
+
+
+def linked_model():
+    nodes = [ Node(0.0, 0.0), Node(3.0, 0.0), Node(3.0, 4.0), Node(3.0, 4.0), Node(6.0, 4.0) ]
+    elements = [ Beam2D(nodes[0], nodes[1], ElasticSection()),
+                 Truss(nodes[1], nodes[2], FiberMaterial()),
+                 Truss(nodes[3], nodes[4], FiberMaterial()) ]
+    nodes[3].make_follower(nodes[2])
+
+    for k, node in enumerate(nodes):
+        if node.isLead():
+            node.setDisp(0.1 * k + 0.01 * np.arange(node.ndofs))
+            node.setLoad(1.0 + k + np.arange(node.ndofs), list(node.dofs))
+
+    return nodes, elements
+
+
+def number_dofs(nodes):
+    starts = np.zeros(Node.POOL.count, dtype=np.intp)
+    ndof = 0
+    for node in nodes:
+        if node.isLead():
+            node.setStart(ndof)
+            starts[node._row] = ndof
+            ndof += node.ndofs
+    return starts, ndof
+
+
+def test_gather_matches_nodes():
+    nodes, elements = linked_model()
+    starts, ndof = number_dofs(nodes)
+
+    dofmap = DofMap(elements, Node.POOL, nodes)
+    gidx, u_e, f_e = dofmap.gather(starts)
+
+    ref_idx  = []
+    ref_disp = []
+    ref_load = []
+    for element in elements:
+        idx = dofmap.elementIndex(gidx, element)
+        for node, idxK in zip(element.nodes, idx):
+            assert np.array_equal(idxK, node.getIdx4Element(element))
+            ref_idx.append(node.getIdx4Element(element))
+            ref_disp.append(node.getDisp(caller=element))
+            lead = node if node.isLead() else node.lead
+            ref_load.append(lead.getLoad()[lead.dof_maps[element]])
+
+    assert np.array_equal(gidx, np.concatenate(ref_idx))
+    assert np.allclose(u_e, np.concatenate(ref_disp))
+    assert np.allclose(f_e, np.concatenate(ref_load))
+
+    # the follower adds no d.o.f.s of its own
+    assert ndof == 2 + 3 + 2 + 2
+    assert np.array_equal(dofmap.elementIndex(gidx, elements[2])[0],
+                          dofmap.elementIndex(gidx, elements[1])[1])
+
+    # a subset of elements in the requested order
+    sub_idx, sub_u, _ = dofmap.gather(starts, elem_ids=[2, 0])
+    assert np.array_equal(sub_idx, np.concatenate([ node.getIdx4Element(elements[2]) for node in elements[2].nodes ]
+                                                  + [ node.getIdx4Element(elements[0]) for node in elements[0].nodes ]))
+    assert np.allclose(sub_u, np.concatenate([ node.getDisp(caller=elements[2]) for node in elements[2].nodes ]
+                                             + [ node.getDisp(caller=elements[0]) for node in elements[0].nodes ]))
+
+
+def test_updateDisp_matches_nodes():
+    nodes, elements = linked_model()
+    starts, ndof = number_dofs(nodes)
+    before = [ node.getDisp().copy() for node in nodes ]
+
+    dofmap = DofMap(elements, Node.POOL, nodes)
+    dU = np.linspace(0.5, 1.0, ndof)
+    dofmap.updateDisp(dU)
+
+    for node, U in zip(nodes, before):
+        if node.isLead():
+            assert np.allclose(node.getDisp(), U + dU[node.getIdx4DOFs()])
+
+    assert np.allclose(nodes[3].getDisp(), nodes[2].getDisp())
+
+
+def test_isCurrent_follows_the_model():
+    nodes, elements = linked_model()
+    dofmap = DofMap(elements, Node.POOL, nodes)
+    assert dofmap.isCurrent(elements, nodes)
+
+    # a new d.o.f. at an existing node changes the layout
+    Beam2D(nodes[2], nodes[4], ElasticSection())
+    assert not dofmap.isCurrent(elements, nodes)
+
+
+def test_scatter_add_matches_dense_sum():
+    rng = np.random.default_rng(3)
+    idx = rng.integers(0, 12, 50)
+    values = rng.normal(size=50)
+
+    target = np.ones(12)
+    scatter_add(target, idx, values)
+
+    dense = np.ones(12)
+    for k, v in zip(idx, values):
+        dense[k] += v
+
+    assert np.allclose(target, dense)
+
+
+def test_gather():
+    U = np.arange(10.0) ** 2
+    idx = np.array([3, 3, 0, 9])
+    assert np.array_equal(gather(U, idx), U[idx])
+
+    out = np.empty(4)
+    assert gather(U, idx, out=out) is out
@@ -0,0 +1,56 @@
+import contextlib
+import io
+
+import numpy as np
+
+from femedu.domain import Node
+from femedu.elements.linear import Truss
+from femedu.elements.ElementBatch import ElementBatch
+from femedu.materials import FiberMaterial
+
+
+def truss_chain(n):
+    nodes = [ Node(float(i), 0.5*i) for i in range(n + 1) ]
+    elements = [ Truss(nodes[i], nodes[i+1], FiberMaterial({'E': 100., 'A': 2.0, 'fy': 1.0}))
+                 for i in range(n) ]
+    return nodes, elements
+
+
+def test_setStrainBatch_matches_setStrain():
+    rng = np.random.default_rng(1)
+    single = [ FiberMaterial({'E': 100., 'fy': fy}) for fy in rng.uniform(0.5, 2.0, 20) ]
+    batch  = [ FiberMaterial({'E': 100., 'fy': mat.fy}) for mat in single ]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for step in range(10):
+            eps = rng.normal(0.0, 0.02, 20)
+
+            sig, Et = FiberMaterial.setStrainBatch(batch, eps)
+
+            for k, mat in enumerate(single):
+                mat.setStrain({'xx': eps[k]})
+                assert sig[k] == mat.getStress()['xx']
+                assert Et[k] == mat.getStiffness()
+                assert batch[k].plastic_strain == mat.plastic_strain
+
+
+def test_truss_batch_matches_updateState():
+    nodes_a, elements_a = truss_chain(10)
+    nodes_b, elements_b = truss_chain(10)
+
+    batches = ElementBatch.group(elements_b, supported_only=True)
+    assert len(batches) == 1
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        for step in range(1, 4):
+            for k, (nd_a, nd_b) in enumerate(zip(nodes_a, nodes_b)):
+                U = [0.004 * step * k**2 % 0.07, -0.002 * step * k]
+                nd_a.setDisp(U)
+                nd_b.setDisp(U)
+
+            batches[0].update()
+
+            for elem_a, elem_b in zip(elements_a, elements_b):
+                assert np.array_equal(elem_a.getForce(), elem_b.getForce())
+                assert np.array_equal(elem_a.getStiffness(), elem_b.getStiffness())
+                assert elem_a.material.plastic_strain == elem_b.material.plastic_strain
@@ -0,0 +1,36 @@
+import numpy as np
+
+from femedu.domain import Node
+from femedu.elements.linear import Truss, Triangle6
+from femedu.materials import FiberMaterial, PlaneStress
+
+
+def test_getForce_follows_setDisp():
+    nd0 = Node(0.0, 0.0)
+    nd1 = Node(3.0, 0.0)
+    elem = Truss(nd0, nd1, FiberMaterial({'E': 100., 'A': 1.0}))
+
+    F0 = [ np.copy(f) for f in elem.getForce() ]
+    assert np.allclose(F0, 0.0)
+
+    nd1.setDisp([0.3, 0.0])
+    F1 = elem.getForce()
+    assert np.allclose(F1[0], [-10., 0.])
+    assert np.allclose(F1[1], [ 10., 0.])
+
+    nd1.setDisp([0.0, 0.0])
+    assert np.allclose(elem.getForce(), 0.0)
+
+
+def test_getStiffness_with_replaced_block():
+    nodes = [ Node(0.0, 0.0), Node(1.0, 0.0), Node(0.0, 1.0),
+              Node(0.5, 0.0), Node(0.5, 0.5), Node(0.0, 0.5) ]
+    elem = Triangle6(*nodes, PlaneStress())
+    elem.getStiffness()
+
+    # a block that no longer is a view into the contiguous storage
+    elem.Kt[2][3] = 7. * np.ones((2, 2))
+    elem._state_token = elem._poolToken()
+
+    KT = elem.getStiffness()
+    assert np.allclose(KT[2][3], 7.)
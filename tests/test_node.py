@@ -0,0 +1,47 @@
+import numpy as np
+
+from femedu.domain import Node
+from femedu.elements.linear import Truss, Beam2D
+from femedu.materials import FiberMaterial, ElasticSection
+
+
+def truss_nodes():
+    nd0 = Node(0.0, 0.0)
+    nd1 = Node(3.0, 0.0)
+    elem = Truss(nd0, nd1, FiberMaterial())
+    return nd0, nd1, elem
+
+
+def test_getDisp_by_dofs():
+    nd0, nd1, elem = truss_nodes()
+    nd1.setDisp([0.1, 0.2])
+
+    assert np.allclose(nd1.getDisp(dofs=('uy',)), [0.2])
+    assert np.allclose(nd1.getDisp(dofs='uy'), [0.2])
+    assert np.allclose(nd1.getDisp(dofs=['uy', 'ux']), [0.2, 0.1])
+    assert np.allclose(nd1.getDisp(caller=elem), [0.1, 0.2])
+    assert np.allclose(nd1.getDisp(), [0.1, 0.2])
+
+
+def test_getDisp_missing_dofs_are_zero():
+    nd0, nd1, elem = truss_nodes()
+    nd1.setDisp([0.1, 0.2])
+
+    # 'rz' is used by the beam but not by nd1; 'xx' is unknown to the pool
+    Beam2D(Node(0.0, 1.0), Node(3.0, 1.0), ElasticSection())
+    assert np.allclose(nd1.getDisp(dofs=('ux', 'rz')), [0.1, 0.0])
+    assert np.allclose(nd1.getDisp(dofs=('xx', 'uy')), [0.0, 0.2])
+
+
+def test_getLoad_returns_new_arrays():
+    nd0, nd1, elem = truss_nodes()
+    nd1.setLoad([1.0, 2.0], ['ux', 'uy'])
+
+    P1 = nd1.getLoad()
+    P2 = nd1.getLoad()
+    assert np.allclose(P1, [1.0, 2.0])
+    assert P1 is not P2
+
+    P1[0] = 99.
+    assert np.allclose(nd1.getLoad(), [1.0, 2.0])
+    assert np.allclose(nd1.getLoad(['uy', 'rz']), [2.0, 0.0])
@@ -0,0 +1,172 @@
+import gc
+
+import numpy as np
+
+from femedu.domain import Node
+from femedu.domain.NodePool import NodePool
+from femedu.elements.linear import Truss, Beam2D
+from femedu.materials import FiberMaterial, ElasticSection
+
+
+class Owner():
+    pass
+
+
+def test_rows_are_allocated_in_order():
+    pool = NodePool(capacity=4)
+    owners = [ Owner() for k in range(3) ]
+    rows = [ pool.register((float(k), 1.0), owner) for k, owner in enumerate(owners) ]
+
+    assert rows == [0, 1, 2]
+    assert len(pool) == 3
+    assert np.all(pool.active[:3])
+    assert np.allclose(pool.positions[1], [1.0, 1.0, 0.0])
+    assert list(pool.spatial_dim[:3]) == [2, 2, 2]
+
+
+def test_rows_of_deleted_owners_are_released_and_reused():
+    pool = NodePool(capacity=4)
+    owners = [ Owner() for k in range(4) ]
+    for k, owner in enumerate(owners):
+        pool.register((float(k),), owner)
+    pool.loads[2, 0] = 5.0
+    pool.fixity[2, 1] = True
+
+    del owners[2]
+    gc.collect()
+
+    assert pool.collect() == 1
+    assert len(pool) == 3
+    assert not pool.active[2]
+    assert pool.loads[2, 0] == 0.0
+    assert not pool.fixity[2, 1]
+
+    # the released row is reused before the pool grows
+    owners.append(Owner())
+    assert pool.register((7.0,), owners[-1]) == 2
+    assert pool.capacity == 4
+    assert pool.positions[2, 0] == 7.0
+
+
+def test_register_collects_before_growing():
+    pool = NodePool(capacity=2)
+    keep = Owner()
+    pool.register((0.0,), keep)
+    pool.register((1.0,), Owner())   # deleted right away
+
+    gc.collect()
+    late = [ Owner(), Owner() ]
+    assert pool.register((2.0,), late[0]) == 1
+    assert pool.capacity == 2
+
+    pool.register((3.0,), late[1])
+    assert pool.capacity == 4
+    assert pool.count == 3
+
+
+def test_new_dof_codes_extend_the_columns():
+    pool = NodePool(capacity=2)
+    ncols = pool.fixity.shape[1]
+    for k in range(ncols):
+        pool.slot(f"d{k}")
+
+    assert pool.fixity.shape[1] == 2 * ncols
+    assert pool.disps.shape[1] == 2 * ncols
+    assert pool.slot('ux') == 0
+    assert pool.slot('d0') == len(pool.dof_codes) - ncols
+
+
+def test_tokens_follow_changes_of_their_rows():
+    pool = NodePool(capacity=8)
+    owners = [ Owner() for k in range(4) ]
+    for owner in owners:
+        pool.register((0.0, 0.0), owner)
+
+    T01 = pool.token([0, 1])
+    T23 = pool.token([2, 3])
+
+    pool.touch(1)
+    assert pool.token([0, 1])[1] > T01[1]
+    assert pool.token([0, 1])[0] == T01[0]
+    assert pool.token([2, 3]) == T23
+
+    T01 = pool.token([0, 1])
+    pool.touch_layout([0])
+    assert pool.token([0, 1])[0] > T01[0]
+    assert pool.token([2, 3]) == T23
+
+    # row 3 follows row 0: its displacements live in row 0
+    pool.lead[3] = 0
+    pool.touch_layout([3, 0])
+    T23 = pool.token([2, 3])
+    pool.touch(0)
+    assert pool.token([2, 3])[1] > T23[1]
+
+
+def test_tokens_match_token():
+    pool = NodePool(capacity=8)
+    owners = [ Owner() for k in range(6) ]
+    for owner in owners:
+        pool.register((0.0, 0.0), owner)
+    pool.touch([1, 4])
+    pool.touch_layout([2])
+    pool.lead[5] = 1
+
+    groups = np.array([[0, 1], [2, 3], [4, 5]])
+    assert pool.tokens(groups) == [ pool.token(rows) for rows in groups ]
+
+
+def test_dof_slots_of_linked_elements():
+    nd0 = Node(0.0, 0.0)
+    nd1 = Node(3.0, 0.0)
+    nd2 = Node(3.0, 4.0)
+    Beam2D(nd0, nd1, ElasticSection())
+    Truss(nd1, nd2, FiberMaterial())
+
+    pool = Node.POOL
+    table = nd1._dofTable()
+
+    # the beam requested uy, rz first; the truss reuses uy and adds ux
+    assert nd1.ndofs == 3
+    assert table[pool.slots['uy']] == 0
+    assert table[pool.slots['rz']] == 1
+    assert table[pool.slots['ux']] == 2
+    assert table[pool.slots['uz']] == -1
+    assert nd2.ndofs == 2 and not nd2.hasDOF('rz')
+
+    assert list(nd1.getIdx4DOFs(['ux', 'rz'], local=True)) == [2, 1]
+    assert list(nd1._slots) == [ pool.slots[dof] for dof in ('uy', 'rz', 'ux') ]
+    assert nd1.dofs == {'uy': 0, 'rz': 1, 'ux': 2}
+
+
+def test_tied_nodes_share_the_lead_row():
+    nd0 = Node(0.0, 0.0)
+    nd1 = Node(3.0, 0.0)
+    nd2 = Node(3.0, 0.0)
+    nd3 = Node(6.0, 0.0)
+    elem_a = Truss(nd0, nd1, FiberMaterial())
+    elem_b = Truss(nd2, nd3, FiberMaterial())
+
+    nd2.setLoad([1.0], ['ux'])
+    nd2.fixDOF('uy')
+    nd2.make_follower(nd1)
+
+    pool = Node.POOL
+    assert pool.lead[nd2._row] == nd1._row
+    assert not nd2.isLead()
+
+    # loads and fixities move to the lead node
+    assert np.allclose(nd1.getLoad(), [1.0, 0.0])
+    assert nd1.isFixed('uy')
+    assert nd2.isFixed('uy')
+
+    # both elements see the displacements of the lead node
+    nd1.setDisp([0.1, 0.2])
+    assert np.allclose(nd2.getDisp(), [0.1, 0.2])
+    assert np.allclose(nd2.getDisp(caller=elem_b), [0.1, 0.2])
+    assert np.allclose(nd1.getDisp(caller=elem_a), [0.1, 0.2])
+
+    # a state change of the lead node invalidates elements attached to the follower
+    T = elem_b._poolToken()
+    nd1.setDisp([0.3, 0.2])
+    assert elem_b._poolToken() != T
@@ -0,0 +1,64 @@
+import numpy as np
+
+from femedu.recorder import Record
+
+
+def test_record_grows_past_its_capacity():
+    rec = Record(key='ux', label='node 1')
+    n = 3 * Record.CAPACITY + 5
+    for k in range(n):
+        rec.addData(float(k))
+
+    assert len(rec) == n
+    assert isinstance(rec.data, np.ndarray)
+    assert np.array_equal(rec.data, np.arange(n, dtype=float))
+
+
+def test_record_of_arrays():
+    rec = Record()
+    for k in range(Record.CAPACITY + 1):
+        rec.addData([k, -k])
+
+    assert rec.data.shape == (Record.CAPACITY + 1, 2)
+    assert np.array_equal(rec.data[-1], [Record.CAPACITY, -Record.CAPACITY])
+
+
+def test_getData_returns_a_copy():
+    rec = Record(label='stress')
+    rec.addData(1.0)
+    rec.addData(2.0)
+
+    label, data = rec.getData()
+    data[0] = 99.
+    assert label == 'stress'
+    assert np.array_equal(rec.getData()[1], [1.0, 2.0])
+
+
+def test_inconsistent_values_fall_back_to_a_list():
+    rec = Record()
+    rec.addData([1.0, 2.0])
+    rec.addData([3.0, 4.0])
+    rec.addData([5.0])
+    rec.addData('done')
+
+    assert isinstance(rec.data, list)
+    assert len(rec) == 4
+    assert np.array_equal(rec.data[1], [3.0, 4.0])
+    assert rec.data[2] == [5.0]
+    assert rec.data[3] == 'done'
+
+
+def test_reset_and_data_setter():
+    rec = Record()
+    rec.addData('text')
+    rec.reset()
+    assert len(rec) == 0
+
+    # the array storage is used again after a reset
+    rec.addData([1.0, 2.0, 3.0])
+    assert isinstance(rec.data, np.ndarray)
+    assert rec.data.shape == (1, 3)
+
+    rec.data = [0.5, 1.5, 2.5]
+    assert len(rec) == 3
+    assert np.array_equal(rec.data, [0.5, 1.5, 2.5])